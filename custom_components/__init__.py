@@ -0,0 +1 @@
+"""Custom components for tests."""
@@ -7,22 +7,38 @@ https://github.com/jo-anb/simple-plant-extended
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.core import async_get_hass
-from homeassistant.helpers.config_validation import config_entry_only_config_schema
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
     EventDeviceRegistryUpdatedData,
-    async_entries_for_config_entry,
     async_get,
 )
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.util import slugify
 
 from .config_flow import remove_photo
-from .const import DOMAIN, LOGGER, PLATFORMS
-from .coordinator import SimplePlantExtendedCoordinator
+from .const import (
+    CONF_DEBUG,
+    CONF_SLOW_STEP_THRESHOLD,
+    DATA_DEVICE_ENTRIES,
+    DEFAULT_SLOW_STEP_THRESHOLD,
+    DOMAIN,
+    FLEET_PLATFORMS,
+    LOGGER,
+)
+from .coordinator import (
+    CARE_SCHEDULE_KEYS,
+    SIGNAL_FLEET_UPDATED,
+    SimplePlantExtendedCoordinator,
+)
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -30,12 +46,54 @@ if TYPE_CHECKING:
     from homeassistant.helpers.typing import ConfigType
 
 
-CONFIG_SCHEMA = config_entry_only_config_schema(DOMAIN)
+# Plants are set up from the UI, only the debug mode is set in YAML
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_DEBUG): vol.Schema(
+                    {
+                        vol.Optional(
+                            CONF_SLOW_STEP_THRESHOLD,
+                            default=DEFAULT_SLOW_STEP_THRESHOLD,
+                        ): vol.All(vol.Coerce(float), vol.Range(min=0.001)),
+                    }
+                ),
+            }
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
-async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Simple Plant component."""
+    if (debug := config.get(DOMAIN, {}).get(CONF_DEBUG)) is not None:
+        from .debug import async_setup_debug  # noqa: PLC0415
+
+        async_setup_debug(hass, debug[CONF_SLOW_STEP_THRESHOLD])
     hass.data.setdefault(DOMAIN, {})
+    device_entries: dict[str, str] = hass.data.setdefault(DATA_DEVICE_ENTRIES, {})
+    async_setup_services(hass)
+
+    # Fleet entities, covering all plants
+    for platform in FLEET_PLATFORMS:
+        hass.async_create_task(async_load_platform(hass, platform, DOMAIN, {}, config))
+
+    @callback
+    def _is_plant_renamed(event_data: EventDeviceRegistryUpdatedData) -> bool:
+        """Only let renames of plant devices through."""
+        return (
+            event_data["action"] == "update"
+            and event_data["device_id"] in device_entries
+            and "name_by_user" in event_data["changes"]
+        )
+
+    hass.bus.async_listen(
+        EVENT_DEVICE_REGISTRY_UPDATED,
+        partial(on_device_registry_update_handler, hass),
+        event_filter=_is_plant_renamed,
+    )
     return True
 
 
@@ -44,122 +102,135 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     LOGGER.debug("Setting up entry %s", entry.title)
     coordinator = SimplePlantExtendedCoordinator(hass, entry)
+    await coordinator.photos.async_load()
 
     if entry.state == ConfigEntryState.SETUP_IN_PROGRESS:
         await coordinator.async_config_entry_first_refresh()
     else:
         await coordinator.async_request_refresh()
 
+    coordinator.async_setup_care_types()
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+
+    if device := async_get(hass).async_get_device(
+        identifiers=coordinator.device_info["identifiers"]
+    ):
+        hass.data[DATA_DEVICE_ENTRIES][device.id] = entry.entry_id
 
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_entry))
     entry.async_on_unload(
-        hass.bus.async_listen(
-            EVENT_DEVICE_REGISTRY_UPDATED,  # type: ignore[arg-type]
-            on_device_registry_update_handler,
-        )
+        coordinator.clock.async_track_midnight(hass, coordinator.async_handle_midnight)
     )
-
     return True
 
 
-async def on_device_registry_update_handler(
+@callback
+def on_device_registry_update_handler(
+    hass: HomeAssistant,
     event: Event[EventDeviceRegistryUpdatedData],
 ) -> None:
-    """Handle update of device registry."""
-    changes = event.data.get("changes")
-    if not changes or not isinstance(changes, dict) or "name_by_user" not in changes:
-        return
-    # Get device
-    hass = async_get_hass()
+    """Handle the renaming of a plant device."""
+    device_id = event.data["device_id"]
     device_registry = async_get(hass)
-    device = device_registry.async_get(event.data.get("device_id"))
-    if not device:
+    device = device_registry.async_get(device_id)
+    entry_id = hass.data[DATA_DEVICE_ENTRIES].get(device_id)
+    if not device or not entry_id:
         return
-    # Get entries
-    entries: set[ConfigEntry] = set()
-    for entry_id in device.config_entries:
-        entry = hass.config_entries.async_get_entry(entry_id)
-        if entry:
-            entries.add(entry)
-    # Update entries
-    for entry in entries:
-        device_name_from_entry_title = entry.title[0].upper() + entry.title[1:]
-        if (
-            device_name_from_entry_title == device.name_by_user
-            or device.name_by_user is None
-        ):
-            return
-        LOGGER.debug(
-            "Renaming entry %s to %s",
-            entry.title,
-            device.name_by_user,
-        )
-        data = dict(entry.data)
-        data.update(
-            {
-                "name": device.name_by_user,
-                "name_by_user": device.name_by_user,
-            }
-        )
-        new_title = device.name_by_user
-
-        coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
-        await coordinator.async_rename_device(slugify(new_title))
-
-        await hass.config_entries.async_unload(entry.entry_id)
-        hass.config_entries.async_update_entry(entry, data=data, title=new_title)
-        hass.config_entries.async_schedule_reload(entry.entry_id)
-        device_registry.async_remove_device(device.id)
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if not entry:
+        return
+    # Update entry
+    device_name_from_entry_title = entry.title[0].upper() + entry.title[1:]
+    if (
+        device_name_from_entry_title == device.name_by_user
+        or device.name_by_user is None
+    ):
+        return
+    LOGGER.debug(
+        "Renaming entry %s to %s",
+        entry.title,
+        device.name_by_user,
+    )
+    data = dict(entry.data)
+    data.update(
+        {
+            "name": device.name_by_user,
+            "name_by_user": device.name_by_user,
+        }
+    )
+    # The update listener migrates the plant to its new name
+    hass.config_entries.async_update_entry(
+        entry, data=data, title=device.name_by_user
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle unloading of an entry."""
     # Unload platforms
     LOGGER.debug("Unloading %s", entry.title)
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, coordinator.platforms
+    )
     LOGGER.debug("Unloading status : %s", "OK" if unload_ok else "NOK")
 
     # Remove entry data
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_dispatcher_send(hass, SIGNAL_FLEET_UPDATED, coordinator, None)
+        device_entries = hass.data[DATA_DEVICE_ENTRIES]
+        for device_id, entry_id in list(device_entries.items()):
+            if entry_id == entry.entry_id:
+                del device_entries[device_id]
 
     return unload_ok
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
+    from .statistics import async_get_statistics, care_statistic_id  # noqa: PLC0415
+
     # Remove storage
     coordinator = SimplePlantExtendedCoordinator(hass, entry)
     await coordinator.remove_device_from_storage()
 
-    # Remove photo
-    remove_photo(hass, entry)
+    # Remove photos
+    await hass.async_add_executor_job(remove_photo, hass, entry)
+    await coordinator.photos.async_remove()
+
+    # Remove care history
+    async_get_statistics(hass).async_clear(
+        care_statistic_id(entry.entry_id, care) for care in CARE_SCHEDULE_KEYS
+    )
 
 
-async def async_reload_entry(
+async def async_update_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    if entry.title != entry.data.get("name"):
-        LOGGER.info("Changing name of %s to %s", entry.data.get("name"), entry.title)
-        # Migrate storage storage
-        coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    """Apply config entry changes to the loaded plant, in place."""
+    coordinator: SimplePlantExtendedCoordinator | None = hass.data[DOMAIN].get(
+        entry.entry_id
+    )
+    if coordinator is None:
+        return
+    if slugify(entry.title) != coordinator.device:
+        LOGGER.info("Changing name of %s to %s", coordinator.device, entry.title)
         await coordinator.async_rename_device(slugify(entry.title))
-        # Update entry
+    if entry.title != entry.data.get("name"):
         data = dict(entry.data)
         data.update({"name": entry.title, "name_by_user": entry.title})
+        # Calls this listener again, with nothing left to rename
         hass.config_entries.async_update_entry(entry, data=data)
-        # remove obsolete device
-        device_name = entry.title[0].upper() + entry.title[1:]
-        device_registry = async_get(hass)
-        for device in async_entries_for_config_entry(device_registry, entry.entry_id):
-            if device.name != device_name:
-                device_registry.async_remove_device(device.id)
-        return
-    LOGGER.info("Reloading entry %s", entry.title)
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
\ No newline at end of file
+    coordinator.async_update_device()
+    if coordinator.compact != bool(entry.data.get("compact", False)):
+        # Switching modes changes the platforms, remove the entities of the
+        # old mode and set the plant up again
+        entity_registry = er.async_get(hass)
+        for registry_entry in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        ):
+            entity_registry.async_remove(registry_entry.entity_id)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -9,28 +9,32 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_change,
-)
-from homeassistant.util.dt import as_local
+from homeassistant.const import STATE_ON
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
+from .coordinator import SIGNAL_SCHEDULE_UPDATED
+from .entity import SimplePlantExtendedEntity
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from datetime import date
 
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from .coordinator import SimplePlantExtendedCoordinator
+    from .coordinator import PlantSchedule, SimplePlantExtendedCoordinator
 
 
-class SimplePlantExtendedBinarySensor(BinarySensorEntity):
+class SimplePlantExtendedBinarySensor(
+    SimplePlantExtendedEntity, BinarySensorEntity, RestoreEntity
+):
     """simple_plant_extended binary_sensor base class."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _fallback_value: bool = False
 
     def __init__(
@@ -44,8 +48,8 @@ class SimplePlantExtendedBinarySensor(BinarySensorEntity):
         self._hass = hass
         self.entity_description = description
         self.coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-        self._attr_should_poll = True
+        # "todo" and "problem" are about watering, others are prefixed
+        self._care = description.key.rpartition("_")[0] or "watering"
 
         device = self.coordinator.device
 
@@ -71,66 +75,37 @@ class SimplePlantExtendedBinarySensor(BinarySensorEntity):
         """Return the device name."""
         return self.coordinator.device
 
-    async def get_dates(self) -> dict[str, datetime] | None:
-        """Get dates from relevants device entites states."""
-        return await self.coordinator.get_dates()
-
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        device = self.coordinator.device
-
-        last_date = None
-        daysbetween = None
-        if self.entity_description.key == "todo":
-            last_date = f"date.{DOMAIN}_last_watered_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_waterings_{self.device}"
-        if "fertilization" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_fertilized_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_fertilizations_{self.device}"
-        if "misting" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_misted_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_mistings_{self.device}"
-        if "cleaning" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_cleaned_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_cleanings_{self.device}"
-
-        # Subscribe to state changes
-        if last_date not in ["unknown", "", "None", None]:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass,
-                    last_date,
-                    self._update_state,
-                )
-            )
-        if daysbetween not in ["unknown", "", "None", None]:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass,
-                    daysbetween,
-                    self._update_state,
-                )
-            )
-            
+        # Last known state until the schedule tells otherwise
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._fallback_value = last_state.state == STATE_ON
         self.async_on_remove(
-            async_track_time_change(
+            async_dispatcher_connect(
                 self.hass,
-                self._update_state,
-                hour=0,
-                minute=0,
-                second=0,
+                SIGNAL_SCHEDULE_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._async_handle_schedule,
             )
         )
 
         # Initial update
-        await self._update_state()
+        if (schedule := self.coordinator.schedule) is not None:
+            self._async_handle_schedule(schedule)
 
-    async def _update_state(
-        self,
-        _event: Event[EventStateChangedData] | datetime | None = None,
-    ) -> None:
-        """Update the binary sensor state based on other entities."""
+    @callback
+    def _async_handle_schedule(self, schedule: PlantSchedule) -> None:
+        """Update the binary sensor state from the plant schedule."""
+        if (next_date := schedule.next.get(self._care)) is None:
+            return
+        is_on = self._is_on(schedule.today, next_date)
+        if is_on == self._attr_native_value:
+            return
+        self._attr_native_value = is_on
+        self.async_write_ha_state()
+
+    def _is_on(self, today: date, next_date: date) -> bool:
+        """Return the state for today and the next action date."""
         raise NotImplementedError
 
 
@@ -139,27 +114,9 @@ class SimplePlantExtendedTodo(SimplePlantExtendedBinarySensor):
 
     _fallback_value = False
 
-    async def _update_state(self, _event: Event | None = None) -> None:
-        """Update the binary sensor state based on other entities."""
-        dates = await self.get_dates()
-
-        if not dates:
-            return
-
-        next_date = None
-        if self.entity_description.key == "todo":
-            next_date = "next_watering"
-        if "fertilization" in self.entity_description.key:
-            next_date = "next_fertilization"
-        if "mist" in self.entity_description.key:
-            next_date = "next_misting"
-        if "clean" in self.entity_description.key:
-            next_date = "next_cleaning"
-
-        self._attr_native_value = (
-            as_local(dates["today"]).date() >= as_local(dates[next_date]).date()
-        )
-        self.async_write_ha_state()
+    def _is_on(self, today: date, next_date: date) -> bool:
+        """Return true if the action is due."""
+        return today >= next_date
 
 
 class SimplePlantExtendedProblem(SimplePlantExtendedBinarySensor):
@@ -168,27 +125,9 @@ class SimplePlantExtendedProblem(SimplePlantExtendedBinarySensor):
     _fallback_value = False
     # _attr_translation_key = "problem"
 
-    async def _update_state(self, _event: Event | None = None) -> None:
-        """Update the binary sensor state based on other entities."""
-        dates = await self.get_dates()
-
-        if not dates:
-            return
-        
-        next_date = None
-        if self.entity_description.key == "problem":
-            next_date = "next_watering"
-        if "fertilization" in self.entity_description.key:
-            next_date = "next_fertilization"
-        if "misting" in self.entity_description.key:
-            next_date = "next_misting"
-        if "cleaning" in self.entity_description.key:
-            next_date = "next_cleaning"
-
-        self._attr_native_value = (
-            as_local(dates["today"]).date() > as_local(dates[next_date]).date()
-        )
-        self.async_write_ha_state()
+    def _is_on(self, today: date, next_date: date) -> bool:
+        """Return true if the action is late."""
+        return today > next_date
 
 
 ENTITIES = [
@@ -277,6 +216,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
-    async_add_entities(
-        entity["class"](hass, entry, entity["description"]) for entity in ENTITIES
+    coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_add_platform_entities(
+        async_add_entities,
+        lambda: (
+            entity["class"](hass, entry, entity["description"]) for entity in ENTITIES
+        ),
     )
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
 import string
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
 from homeassistant.components.button import (
     ButtonEntity,
     ButtonEntityDescription,
 )
+from homeassistant.util.dt import as_local, as_utc, utcnow
 
 from .const import DOMAIN
-from homeassistant.util.dt import as_local, as_utc, utcnow
+from .entity import SimplePlantExtendedEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -56,13 +58,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the button platform."""
-    async_add_entities(
-        SimplePlantExtendedButton(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
+    coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_add_platform_entities(
+        async_add_entities,
+        lambda: (
+            SimplePlantExtendedButton(hass, entry, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
+        ),
     )
 
 
-class SimplePlantExtendedButton(ButtonEntity):
+class SimplePlantExtendedButton(SimplePlantExtendedEntity, ButtonEntity):
     """simple_plant_extended button class."""
 
     _attr_has_entity_name = True
@@ -91,10 +97,6 @@ class SimplePlantExtendedButton(ButtonEntity):
     def device(self) -> str | None:
         """Return the device name."""
         return self.coordinator.device
-        
-    async def get_dates(self) -> dict[str, datetime] | None:
-        """Get dates from relevants device entites states."""
-        return await self.coordinator.get_dates()
 
     async def async_press(self) -> None:
         """Press the button."""
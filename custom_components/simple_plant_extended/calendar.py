@@ -0,0 +1,171 @@
+"""Calendar platform for simple_plant_extended."""
+
+from __future__ import annotations
+
+import heapq
+from datetime import time, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util.dt import as_local
+
+from .clock import async_get_clock
+from .const import DOMAIN
+from .coordinator import SIGNAL_FLEET_UPDATED
+from .entity import SimplePlantExtendedEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import date, datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+    from .coordinator import PlantSchedule, SimplePlantExtendedCoordinator
+
+
+async def async_setup_platform(
+    _hass: HomeAssistant,
+    _config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the care calendar of all plants."""
+    if discovery_info is None:
+        return
+    async_add_entities([SimplePlantExtendedCalendar()])
+
+
+def _plant_care(
+    title: str,
+    schedule: PlantSchedule,
+    care: str,
+    start: date,
+    end: date | None,
+) -> Iterator[tuple[date, str, str]]:
+    """Yield the planned care of a plant as (date, care, plant)."""
+    for day in schedule.occurrences(care, start, end):
+        yield day, care, title
+
+
+@callback
+def async_iter_care(
+    hass: HomeAssistant, start: date, end: date | None = None
+) -> Iterator[tuple[date, str, str]]:
+    """
+    Yield the planned care of all plants from `start`, until before `end`.
+
+    The occurrences of every plant and care type are already in order, a heap
+    merges them lazily. Only the current schedules are read, the care can be
+    iterated outside the event loop.
+    """
+    coordinators: dict[str, SimplePlantExtendedCoordinator] = hass.data[DOMAIN]
+    return heapq.merge(
+        *(
+            _plant_care(coordinator.config_entry.title, schedule, care, start, end)
+            for coordinator in coordinators.values()
+            if (schedule := coordinator.schedule) is not None
+            for care in schedule.next
+        )
+    )
+
+
+def _care_events(care: Iterable[tuple[date, str, str]]) -> Iterator[CalendarEvent]:
+    """
+    Build an all-day event per day and care type, for all plants needing it.
+
+    Large fleets plan thousands of care a month, one event per plant would
+    flood the calendar.
+    """
+    for (day, care_type), plants in groupby(care, key=itemgetter(0, 1)):
+        titles = [title for _, _, title in plants]
+        yield CalendarEvent(
+            start=day,
+            end=day + timedelta(days=1),
+            summary=(
+                f"{care_type.capitalize()}: "
+                + (titles[0] if len(titles) == 1 else f"{len(titles)} plants")
+            ),
+            description="\n".join(titles),
+            uid=f"{DOMAIN}_{care_type}_{day.isoformat()}",
+        )
+
+
+class SimplePlantExtendedCalendar(SimplePlantExtendedEntity, CalendarEntity):
+    """simple_plant_extended calendar of the upcoming care of all plants."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_translation_key = "care"
+    _attr_icon = "mdi:calendar-clock"
+    _attr_unique_id = f"{DOMAIN}_care"
+
+    def __init__(self) -> None:
+        """Initialize the calendar class."""
+        super().__init__()
+        self.entity_id = f"calendar.{DOMAIN}_care"
+        self._event: CalendarEvent | None = None
+        self._update_scheduled = False
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next upcoming care."""
+        return self._event
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_FLEET_UPDATED, self._async_handle_fleet
+            )
+        )
+        self._event = self._next_event()
+
+    @callback
+    def _async_handle_fleet(
+        self,
+        _coordinator: SimplePlantExtendedCoordinator,
+        _schedule: PlantSchedule | None,
+    ) -> None:
+        """Update once for all the plants changed in the same loop iteration."""
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self.hass.loop.call_soon(self._async_update)
+
+    @callback
+    def _async_update(self) -> None:
+        """Write the state if the next upcoming care changed."""
+        self._update_scheduled = False
+        event = self._next_event()
+        if event == self._event:
+            return
+        self._event = event
+        self.async_write_ha_state()
+
+    def _next_event(self) -> CalendarEvent | None:
+        """Find the next upcoming care, from today."""
+        today = async_get_clock(self.hass).today()
+        return next(_care_events(async_iter_care(self.hass, today)), None)
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return the planned care overlapping the given period."""
+        start = as_local(start_date).date()
+        end_local = as_local(end_date)
+        end = end_local.date()
+        if end_local.time() != time.min:
+            end += timedelta(days=1)
+        # Long periods of large fleets hold thousands of care
+        return await hass.async_add_executor_job(
+            list, _care_events(async_iter_care(hass, start, end))
+        )
@@ -0,0 +1,53 @@
+"""Clock of simple_plant_extended."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_CLOCK
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import date, datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+
+class SimplePlantExtendedClock:
+    """
+    Current time and day changes, as the schedules of the plants see them.
+
+    Scheduling reads the time from the clock in hass.data instead of the
+    system, so another clock can be installed before setup to run the plants
+    on a simulated time.
+    """
+
+    def utcnow(self) -> datetime:
+        """Return the current time in UTC."""
+        return dt_util.utcnow()
+
+    def today(self) -> date:
+        """Return the current local date."""
+        return dt_util.as_local(self.utcnow()).date()
+
+    @callback
+    def async_track_midnight(
+        self, hass: HomeAssistant, action: Callable[[datetime], None]
+    ) -> CALLBACK_TYPE:
+        """Call `action` at each local midnight, return a function to stop."""
+        return async_track_time_change(hass, action, hour=0, minute=0, second=0)
+
+
+@callback
+def async_get_clock(hass: HomeAssistant) -> SimplePlantExtendedClock:
+    """Get the clock, creating the system clock on first use."""
+    if (clock := hass.data.get(DATA_CLOCK)) is not None:
+        return clock
+
+    clock = SimplePlantExtendedClock()
+    hass.data[DATA_CLOCK] = clock
+    return clock
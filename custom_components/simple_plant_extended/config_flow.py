@@ -3,10 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from pathlib import Path
 from typing import TYPE_CHECKING
 
-import aiofiles
 import voluptuous as vol
 from homeassistant.components.file_upload import process_uploaded_file
 from homeassistant.config_entries import (
@@ -18,57 +16,58 @@ from homeassistant.config_entries import (
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.util import slugify
-from homeassistant.util.dt import as_local, as_utc, utcnow
-
-from .const import DOMAIN, HEALTH_OPTIONS, IMAGES_MIME_TYPES, LOGGER, STORAGE_DIR, FEED_OPTIONS, ENABLED_OPTIONS, ILLUMINATION_OPTIONS
-
+from homeassistant.util.dt import as_local, as_utc
+
+from .clock import async_get_clock
+from .const import (
+    DOMAIN,
+    ENABLED_OPTIONS,
+    FEED_OPTIONS,
+    HEALTH_OPTIONS,
+    ILLUMINATION_OPTIONS,
+    LOGGER,
+    PHOTO_FORMATS,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-## UTILS
+    from .photo import PhotoSettings
 
+## UTILS
 
-async def save_image(hass: HomeAssistant, file_id: str) -> str:
-    """Permanently save an uploaded image."""
-    with process_uploaded_file(hass, file_id) as uploaded_file:
-        # Save the file
-        storage_dir = Path(hass.config.path(STORAGE_DIR))
-        storage_dir.mkdir(parents=True, exist_ok=True)
 
-        suffix = uploaded_file.suffix
-        if suffix not in IMAGES_MIME_TYPES:
-            raise ValueError
-        file_path = storage_dir / f"{file_id}{suffix}"
+async def save_image(
+    hass: HomeAssistant,
+    file_id: str,
+    settings: PhotoSettings | None = None,
+) -> dict[str, str]:
+    """
+    Permanently save an uploaded image.
 
-        # Safely copy the file using async operations
-        async with aiofiles.open(file_path, "wb") as destination_file:  # noqa: SIM117
-            async with aiofiles.open(uploaded_file, "rb") as source_file:
-                await destination_file.write(await source_file.read())
+    Returns the entry data of the saved photo: `photo`, and `photo_original`
+    when a transcoded photo is stored alongside its original.
+    """
+    # Photos and their transcoding pool are only loaded when saving one
+    from .photo import PhotoSettings, async_store_photo  # noqa: PLC0415
 
-        # relative path
-        return f"/{STORAGE_DIR}/{file_path.name}"
+    # Getting the upload and removing it after use touch the disk
+    upload = process_uploaded_file(hass, file_id)
+    uploaded_file = await hass.async_add_executor_job(upload.__enter__)
+    try:
+        return await async_store_photo(
+            hass, uploaded_file, file_id, settings or PhotoSettings()
+        )
+    finally:
+        await hass.async_add_executor_job(upload.__exit__, None, None, None)
 
 
 def remove_photo(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Remove the photo file of a config entry."""
-    try:
-        # Get the photo path from the entry's data
-        photo_path = entry.data.get("photo")
-        if photo_path:
-            # Convert url path to actual file path
-            file_path = Path(str(hass.config.path(photo_path.lstrip("/"))))
-
-            LOGGER.info("Trying to remove: %s", photo_path)
-
-            # Check if file exists before trying to remove it
-            if file_path.exists():
-                file_path.unlink()
-                LOGGER.info("Successfully removed image file: %s", file_path)
-            else:
-                LOGGER.warning("Image file not found: %s", file_path)
-    except OSError as err:
-        LOGGER.error("Error reading image file %s: %s", file_path, err)
+    """Remove the photo files of a config entry."""
+    from .photo import remove_photo_file  # noqa: PLC0415
+
+    for key in ("photo", "photo_original"):
+        remove_photo_file(hass, entry.data.get(key))
 
 
 ## CONFIG FLOW SCHEMAS
@@ -76,6 +75,8 @@ def remove_photo(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 def user_form() -> vol.Schema:
     """Return a new device form."""
+    from .photo import PhotoSettings  # noqa: PLC0415
+
     LOGGER.debug("config_flow, 1st call : displaying form")
     return vol.Schema(
         {
@@ -177,12 +178,20 @@ def user_form() -> vol.Schema:
             vol.Required("photo"): selector.FileSelector(
                 selector.FileSelectorConfig(accept="image/*")
             ),
+            **photo_settings_form(PhotoSettings()),
+            vol.Optional("compact", default=False): selector.BooleanSelector(),
         }
     )
 
 
-def option_form(suggested_species: str | None = None) -> vol.Schema:
+def option_form(
+    suggested_species: str | None = None,
+    photo_settings: PhotoSettings | None = None,
+    compact: bool = False,  # noqa: FBT001, FBT002
+) -> vol.Schema:
     """Return a device reconfiguration form."""
+    from .photo import PhotoSettings  # noqa: PLC0415
+
     LOGGER.debug("option_flow, 1st call : displaying form")
     return vol.Schema(
         {
@@ -190,10 +199,51 @@ def option_form(suggested_species: str | None = None) -> vol.Schema:
             vol.Optional("photo"): selector.FileSelector(
                 selector.FileSelectorConfig(accept="image/*")
             ),
+            **photo_settings_form(photo_settings or PhotoSettings()),
+            vol.Optional("compact", default=compact): selector.BooleanSelector(),
         }
     )
 
 
+def photo_settings_form(settings: PhotoSettings) -> dict:
+    """Return the photo transcoding fields, defaulting to `settings`."""
+    return {
+        vol.Optional(
+            "photo_format", default=settings.photo_format
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                {
+                    "options": PHOTO_FORMATS,
+                    "custom_value": False,
+                    "sort": False,
+                }
+            )
+        ),
+        vol.Optional(
+            "photo_quality", default=settings.quality
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=10,
+                max=100,
+                mode=selector.NumberSelectorMode.BOX,
+            ),
+        ),
+        vol.Optional(
+            "photo_max_size", default=settings.max_size
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=256,
+                max=8192,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement="px",
+            ),
+        ),
+        vol.Optional(
+            "photo_keep_original", default=settings.keep_original
+        ): selector.BooleanSelector(),
+    }
+
+
 ## CONFIG FLOWS
 
 
@@ -217,6 +267,8 @@ class SimplePlantExtendedFlowHandler(ConfigFlow, domain=DOMAIN):
         1st call = return form to show
         2nd call = return form with user input
         """
+        from .photo import PhotoSettings  # noqa: PLC0415
+
         if user_input is None:
             # 1st call
             return self.async_show_form(step_id="user", data_schema=user_form())
@@ -235,7 +287,7 @@ class SimplePlantExtendedFlowHandler(ConfigFlow, domain=DOMAIN):
         # Verify date
         if "last_watered" in user_input:
             date = as_utc(as_local(datetime.fromisoformat(user_input["last_watered"])))
-            if date > utcnow():
+            if date > async_get_clock(self.hass).utcnow():
                 return self.async_show_form(
                     step_id="user",
                     data_schema=user_form(),
@@ -249,7 +301,8 @@ class SimplePlantExtendedFlowHandler(ConfigFlow, domain=DOMAIN):
         file_id = user_input["photo"]
 
         try:
-            user_input["photo"] = await save_image(self.hass, file_id)
+            photo_settings = PhotoSettings.from_data(user_input)
+            user_input.update(await save_image(self.hass, file_id, photo_settings))
         except ValueError:
             return self.async_show_form(
                 step_id="user",
@@ -258,6 +311,10 @@ class SimplePlantExtendedFlowHandler(ConfigFlow, domain=DOMAIN):
 
         return self.async_create_entry(title=user_input["name"], data=user_input)
 
+    async def async_step_import(self, import_data: dict) -> ConfigFlowResult:
+        """Create a plant of the import_plants service, validated by the importer."""
+        return self.async_create_entry(title=import_data["name"], data=import_data)
+
 
 class SimplePlantExtendedOptionFlowHandler(OptionsFlow):
     """Reconfiguration flow for Simple Plant Extended."""
@@ -274,7 +331,13 @@ class SimplePlantExtendedOptionFlowHandler(OptionsFlow):
         1st call = return form to show
         2nd call = return form with user input
         """
-        form = option_form(self.entry.data.get("species"))
+        from .photo import PhotoSettings  # noqa: PLC0415
+
+        form = option_form(
+            self.entry.data.get("species"),
+            PhotoSettings.from_data(self.entry.data),
+            bool(self.entry.data.get("compact", False)),
+        )
 
         if user_input is None:
             # 1st call
@@ -283,16 +346,37 @@ class SimplePlantExtendedOptionFlowHandler(OptionsFlow):
         if user_input.get("species"):
             self.user_inputs["species"] = user_input["species"]
 
+        self.user_inputs["compact"] = bool(user_input.get("compact", False))
+
+        photo_settings = PhotoSettings.from_data(user_input)
+        self.user_inputs.update(
+            {
+                "photo_format": photo_settings.photo_format,
+                "photo_quality": photo_settings.quality,
+                "photo_max_size": photo_settings.max_size,
+                "photo_keep_original": photo_settings.keep_original,
+            }
+        )
+
         if user_input.get("photo"):
             try:
                 file_id = user_input["photo"]
-                self.user_inputs["photo"] = await save_image(self.hass, file_id)
-                remove_photo(self.hass, self.entry)
+                photo = await save_image(self.hass, file_id, photo_settings)
             except ValueError:
                 return self.async_show_form(
                     step_id="user",
                     errors={"base": "upload_failed_type"},
                 )
+            coordinator = self.hass.data[DOMAIN].get(self.entry.entry_id)
+            if coordinator is not None:
+                # Keep previous photos, the picture shows the latest one
+                coordinator.photos.async_add_photo(photo, coordinator.clock.utcnow())
+            else:
+                self.user_inputs["photo_original"] = None
+                self.user_inputs.update(photo)
+                await self.hass.async_add_executor_job(
+                    remove_photo, self.hass, self.entry
+                )
 
         # On appelle le step de fin pour enregistrer les modifications
         return await self.async_end()
@@ -300,7 +384,7 @@ class SimplePlantExtendedOptionFlowHandler(OptionsFlow):
     async def async_end(self) -> ConfigFlowResult:
         """Finitsh ConfigEntry modification."""
         LOGGER.info(
-            "Entry %s is being recreated",
+            "Entry %s is being updated",
             self.config_entry.entry_id,
         )
 
@@ -6,6 +6,8 @@ from homeassistant.const import Platform
 
 STORAGE_KEY = "simple_plant_extended_data"
 
+PHOTO_TIMELINE_STORAGE_KEY = "simple_plant_extended_photos"
+
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "simple_plant_extended"
@@ -35,6 +37,12 @@ ENABLED_OPTIONS = [
     "off",
 ]
 
+# Optional care types, and the select enabling each of them
+OPTIONAL_CARE_TYPES = {
+    "misting": "misting_enabled",
+    "cleaning": "cleaning_enabled",
+}
+
 ILLUMINATION_OPTIONS = [
     "notset",
     "sunny",
@@ -42,6 +50,22 @@ ILLUMINATION_OPTIONS = [
     "shade",
 ]
 
+# Select settings of a plant, and their options
+PLANT_SETTINGS = {
+    "health": HEALTH_OPTIONS,
+    "feed_method": FEED_OPTIONS,
+    "illumination": ILLUMINATION_OPTIONS,
+    "misting_enabled": ENABLED_OPTIONS,
+    "cleaning_enabled": ENABLED_OPTIONS,
+}
+
+# States of the plant sensor of compact mode, from the most urgent care type
+PLANT_STATES = [
+    "ok",
+    "due",
+    "late",
+]
+
 IMAGES_MIME_TYPES = {
     ".png": "image/png",
     ".jpg": "image/jpeg",
@@ -53,6 +77,49 @@ IMAGES_MIME_TYPES = {
     ".svg": "image/svg+xml",
 }
 
+PHOTO_FORMATS = [
+    "original",
+    "webp",
+    "jpeg",
+]
+
+# Formats that can't be re-encoded without losing information (vector, animation)
+PHOTO_PASSTHROUGH_SUFFIXES = {".svg", ".gif"}
+
+DEFAULT_PHOTO_QUALITY = 80
+
+DEFAULT_PHOTO_MAX_SIZE = 1280
+
+# Rows read, then plants created, per batch of a bulk import
+IMPORT_BATCH_SIZE = 50
+
+DATA_PHOTO_POOL = f"{DOMAIN}_photo_pool"
+
+# Plant device ids mapped to the id of their config entry
+DATA_DEVICE_ENTRIES = f"{DOMAIN}_device_entries"
+
+DATA_STATISTICS = f"{DOMAIN}_statistics"
+
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+DATA_CLOCK = f"{DOMAIN}_clock"
+
+DATA_METRICS = f"{DOMAIN}_metrics"
+
+DATA_DEBUG = f"{DOMAIN}_debug"
+
+# Debug mode, set in configuration.yaml: loop steps held longer are logged
+CONF_DEBUG = "debug"
+CONF_SLOW_STEP_THRESHOLD = "slow_step_threshold"
+DEFAULT_SLOW_STEP_THRESHOLD = 0.05
+
+# Hot paths counted by the metrics
+METRIC_GET_DATES = "get_dates"
+METRIC_SAVE_DATA = "save_data"
+METRIC_LOAD = "load"
+METRIC_REFRESH = "refresh"
+METRIC_STATE_WRITE = "state_write"
+
 
 PLATFORMS: list[Platform] = [
     Platform.BUTTON,
@@ -63,3 +130,16 @@ PLATFORMS: list[Platform] = [
     Platform.SELECT,
     Platform.SENSOR,
 ]
+
+# Entities covering all plants, set up once from discovery
+FLEET_PLATFORMS: list[Platform] = [
+    Platform.CALENDAR,
+    Platform.SENSOR,
+    Platform.TODO,
+]
+
+# Compact mode: a single plant sensor, and the picture
+COMPACT_PLATFORMS: list[Platform] = [
+    Platform.IMAGE,
+    Platform.SENSOR,
+]
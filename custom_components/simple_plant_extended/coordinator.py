@@ -1,23 +1,150 @@
 """Data coordinator for simple_plant_extended."""
 
 from __future__ import annotations
-import asyncio
 
-from datetime import datetime, timedelta
+import math
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import slugify
-from homeassistant.util.dt import as_local, as_utc, utcnow
-
-from .const import DOMAIN, LOGGER, MANUFACTURER
+from homeassistant.util.dt import as_local, as_utc, start_of_local_day
+from homeassistant.util.signal_type import SignalType, SignalTypeFormat
+
+from .clock import async_get_clock
+from .const import (
+    COMPACT_PLATFORMS,
+    DOMAIN,
+    LOGGER,
+    MANUFACTURER,
+    METRIC_GET_DATES,
+    METRIC_REFRESH,
+    OPTIONAL_CARE_TYPES,
+    PLANT_SETTINGS,
+    PLATFORMS,
+)
 from .data import SimplePlantExtendedStore
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.const import Platform
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+# Keyword found in the entity description keys of each optional care type
+OPTIONAL_CARE_KEYWORDS = {
+    "misting": "mist",
+    "cleaning": "clean",
+}
+
+# Keys of the last action date and of the interval of each care type
+CARE_SCHEDULE_KEYS = {
+    "watering": ("last_watered", "days_between_waterings"),
+    "fertilization": ("last_fertilized", "days_between_fertilizations"),
+    "misting": ("last_misted", "days_between_mistings"),
+    "cleaning": ("last_cleaned", "days_between_cleanings"),
+}
+
+# Number of recent refresh durations kept for diagnostics
+REFRESH_HISTORY = 20
+
+# Plants migrated per store write
+MIGRATION_BATCH_SIZE = 50
+
+# Entity ids of the legacy integration, formatted with the domain and device,
+# by the data they migrate to
+LEGACY_ENTITY_IDS = {
+    "last_fertilized": "sensor.{}_feed_lastfeed_{}",
+    "feed_method": "input_select.{}_feed_method_{}",
+    "days_between_fertilizations": "input_number.{}_feed_interval_{}",
+    "misting_enabled": "binary_sensor.{}_care_misting_enabled_{}",
+    "days_between_mistings": "input_number.{}_care_mist_interval_{}",
+    "cleaning_enabled": "binary_sensor.{}_care_cleaning_enabled_{}",
+    "days_between_cleanings": "input_number.{}_care_clean_interval_{}",
+    "next_misting": "sensor.{}_care_next_misting_{}",
+    "next_cleaning": "sensor.{}_care_next_cleaning_{}",
+}
+
+# Legacy states without a value to migrate
+LEGACY_UNSET = ("None", "unknown")
+
+# Care type of each last action date key
+CARE_TYPES_BY_LAST_KEY = {
+    last_key: care for care, (last_key, _) in CARE_SCHEDULE_KEYS.items()
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PlantSchedule:
+    """Care schedule of a plant, keyed by enabled care type."""
+
+    today: date
+    last: dict[str, date]
+    intervals: dict[str, float]
+    next: dict[str, date]
+
+    def occurrences(
+        self, care: str, start: date, end: date | None = None
+    ) -> Iterator[date]:
+        """
+        Yield the planned dates of `care` from `start`, until before `end`.
+
+        Planned dates are the next date, then every interval after it. They
+        are computed directly, without walking the days in between.
+        """
+        first = self.next[care]
+        interval = self.intervals[care]
+        k = max(0, math.ceil((start - first).days / interval))
+        while True:
+            day = first + timedelta(days=k * interval)
+            if end is not None and day >= end:
+                return
+            yield day
+            k += 1
+
+
+# Sent with the new schedule of a plant, formatted with its config entry id
+SIGNAL_SCHEDULE_UPDATED: SignalTypeFormat[PlantSchedule] = SignalTypeFormat(
+    f"{DOMAIN}_schedule_updated_{{}}"
+)
+
+# Sent with a plant and its new schedule, or None once it is unloaded
+SIGNAL_FLEET_UPDATED: SignalType[
+    SimplePlantExtendedCoordinator, PlantSchedule | None
+] = SignalType(f"{DOMAIN}_fleet_updated")
+
+
+def parse_local_date(value: str) -> date | None:
+    """Return the local date of a stored ISO date or datetime."""
+    try:
+        return as_local(datetime.fromisoformat(value)).date()
+    except ValueError:
+        LOGGER.warning("Invalid date: %s", value)
+        return None
+
+
+def optional_care_type(key: str) -> str | None:
+    """Return the optional care type an entity description key belongs to."""
+    if key in OPTIONAL_CARE_TYPES.values():
+        # The selects enabling a care type are always available
+        return None
+    for care, keyword in OPTIONAL_CARE_KEYWORDS.items():
+        if keyword in key:
+            return care
+    return None
 
 
 class SimplePlantExtendedCoordinator(DataUpdateCoordinator[dict]):
@@ -25,6 +152,10 @@ class SimplePlantExtendedCoordinator(DataUpdateCoordinator[dict]):
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
+        # Photos and metrics are only loaded once a plant is set up
+        from .metrics import async_get_metrics  # noqa: PLC0415
+        from .timeline import SimplePlantExtendedPhotoTimeline  # noqa: PLC0415
+
         super().__init__(
             hass,
             LOGGER,
@@ -32,7 +163,14 @@ class SimplePlantExtendedCoordinator(DataUpdateCoordinator[dict]):
         )
         self.device = slugify(entry.title)
         self.store = SimplePlantExtendedStore(hass)
+        self.photos = SimplePlantExtendedPhotoTimeline(hass, entry.entry_id)
+        self.clock = async_get_clock(hass)
+        self.metrics = async_get_metrics(hass)
+        # Durations of the recent refreshes, in ms
+        self.refresh_durations: deque[float] = deque(maxlen=REFRESH_HISTORY)
         self.config_entry = entry
+        # Compact mode: one plant sensor instead of an entity per setting
+        self.compact = bool(entry.data.get("compact", False))
 
         # Set up device info
         name = entry.title[0].upper() + entry.title[1:]
@@ -43,41 +181,317 @@ class SimplePlantExtendedCoordinator(DataUpdateCoordinator[dict]):
             model=entry.data.get("species"),
         )
 
-
+        # Optional care types whose entities are disabled
+        self.disabled_care_types: set[str] = set()
+        self.schedule: PlantSchedule | None = None
+        # Stored last action dates as local dates, parsed once per data update
+        self.dates: dict[str, date] = {}
+        self._entity_factories: list[
+            tuple[AddEntitiesCallback, Callable[[], Iterable[Entity]]]
+        ] = []
+
+    @property
+    def platforms(self) -> list[Platform]:
+        """Return the platforms set up for the plant."""
+        return COMPACT_PLATFORMS if self.compact else PLATFORMS
+
+    async def async_refresh(self) -> None:
+        """Refresh data and update listeners, timing it."""
+        start = perf_counter_ns()
+        await super().async_refresh()
+        duration = perf_counter_ns() - start
+        self.metrics.async_record(METRIC_REFRESH, duration)
+        self.refresh_durations.append(round(duration / 1e6, 3))
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from storage."""
-        await self.store.async_load()
+        """Fetch data from storage, loaded once and kept in memory."""
         return await self.store.async_get_data(self.device)
 
+    @callback
+    def async_setup_care_types(self) -> None:
+        """Disable the entities of care types turned off in storage."""
+        for care, key in OPTIONAL_CARE_TYPES.items():
+            value = (self.data or {}).get(
+                f"{DOMAIN}_{key}_{self.device}", self.config_entry.data.get(key)
+            )
+            if value == "off":
+                self.disabled_care_types.add(care)
+                self._async_disable_care_type_entities(care)
+        self._async_update_schedule()
+
+    @callback
+    def async_add_platform_entities(
+        self,
+        async_add_entities: AddEntitiesCallback,
+        entity_factory: Callable[[], Iterable[Entity]],
+    ) -> None:
+        """
+        Add the entities of a platform, except those of disabled care types.
+
+        `entity_factory` is kept to create the entities again when their care
+        type gets enabled.
+        """
+        self._entity_factories.append((async_add_entities, entity_factory))
+        async_add_entities(
+            entity
+            for entity in entity_factory()
+            if optional_care_type(entity.entity_description.key)
+            not in self.disabled_care_types
+        )
+
+    @callback
+    def async_set_care_type_enabled(self, care: str, enabled: bool) -> None:  # noqa: FBT001
+        """Enable or disable all entities of an optional care type at once."""
+        if enabled != (care in self.disabled_care_types):
+            return
+        LOGGER.debug(
+            "%s: %s %s", self.device, "Enabling" if enabled else "Disabling", care
+        )
+        if not enabled:
+            self.disabled_care_types.add(care)
+            self._async_disable_care_type_entities(care)
+            self._async_update_schedule()
+            return
+
+        self.disabled_care_types.discard(care)
+        self._async_update_schedule()
+        entity_registry = er.async_get(self.hass)
+        for registry_entry in self._care_type_registry_entries(care):
+            if registry_entry.disabled_by is er.RegistryEntryDisabler.CONFIG_ENTRY:
+                entity_registry.async_update_entity(
+                    registry_entry.entity_id, disabled_by=None
+                )
+        for async_add_entities, entity_factory in self._entity_factories:
+            async_add_entities(
+                entity
+                for entity in entity_factory()
+                if optional_care_type(entity.entity_description.key) == care
+            )
+
+    @callback
+    def _async_disable_care_type_entities(self, care: str) -> None:
+        """Disable the registered entities of a care type, removing them."""
+        entity_registry = er.async_get(self.hass)
+        for registry_entry in self._care_type_registry_entries(care):
+            if registry_entry.disabled_by is None:
+                # Re-enabling entities disabled by their config entry doesn't
+                # reload it, so they can be added back in place
+                entity_registry.async_update_entity(
+                    registry_entry.entity_id,
+                    disabled_by=er.RegistryEntryDisabler.CONFIG_ENTRY,
+                )
+
+    @callback
+    def _care_type_registry_entries(self, care: str) -> list[er.RegistryEntry]:
+        """Get the entity registry entries of a care type."""
+        prefix = f"{DOMAIN}_"
+        suffix = f"_{self.device}"
+        return [
+            registry_entry
+            for registry_entry in er.async_entries_for_config_entry(
+                er.async_get(self.hass), self.config_entry.entry_id
+            )
+            if optional_care_type(
+                registry_entry.unique_id.removeprefix(prefix).removesuffix(suffix)
+            )
+            == care
+        ]
+
     async def remove_device_from_storage(self) -> None:
         """Remove entry in storage."""
         await self.store.async_remove_device(self.device)
         await self.async_refresh()
 
     async def async_store_value(self, entity_id: str, value: str) -> None:
-        """Store value in the store."""
-        await self.store.async_save_data(self.device, {entity_id: value})
-        await self.async_refresh()
+        """Store value in the store, refreshing only if it changed."""
+        if await self.store.async_save_data(self.device, {entity_id: value}):
+            await self.async_refresh()
+
+    async def async_update_plant(self, values: Mapping[str, Any]) -> None:
+        """
+        Store dates, intervals and settings of the plant in a single write.
+
+        `values` is keyed like the entity descriptions, with local dates.
+        """
+        now = self.clock.utcnow()
+        data: dict[str, Any] = {}
+        for key, value in values.items():
+            if isinstance(value, date):
+                start_of_day = datetime.combine(value, datetime.min.time())
+                last_date = as_utc(as_local(start_of_day))
+                if last_date > now:
+                    raise ServiceValidationError(
+                        translation_domain=DOMAIN,
+                        translation_key="invalid_future_date",
+                        translation_placeholders={},
+                    )
+                self._async_record_care(key, last_date)
+                data[key] = last_date.isoformat()
+            elif isinstance(value, (int, float)):
+                data[f"{DOMAIN}_{key}_{self.device}"] = str(float(value))
+            else:
+                data[f"{DOMAIN}_{key}_{self.device}"] = value
+        for care, key in OPTIONAL_CARE_TYPES.items():
+            if key in values:
+                self.async_set_care_type_enabled(care, values[key] != "off")
+        if await self.store.async_save_data(self.device, data):
+            await self.async_refresh()
 
     async def async_rename_device(self, new_id: str) -> None:
-        """Migrate data for a device to another name."""
-        await self.store.async_rename_device(self.device, new_id)
-        await self.async_refresh()
+        """
+        Move the plant to another device name, in place.
+
+        Stored data, the device identifiers and the unique and entity ids of
+        the entities are migrated without reloading the platforms.
+        """
+        old_id = self.device
+        if new_id == old_id:
+            return
+        if any(
+            coordinator.device == new_id
+            for coordinator in self.hass.data[DOMAIN].values()
+            if coordinator is not self
+        ):
+            LOGGER.error("%s: Can't rename to %s, name already used", old_id, new_id)
+            return
+        await self.store.async_rename_device(old_id, new_id)
+        self.device = new_id
+        # Re-added entities read their values under their new unique ids
+        self.data = await self.store.async_get_data(new_id)
+
+        # Entities are re-added with this device info when their id changes
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers=self.device_info["identifiers"]
+        )
+        self.device_info["identifiers"] = {(DOMAIN, f"{DOMAIN}_{new_id}")}
+        if device is not None:
+            device_registry.async_update_device(
+                device.id, new_identifiers=self.device_info["identifiers"]
+            )
+        self._async_rename_entities(old_id, new_id)
+        self.async_update_listeners()
+
+    @callback
+    def _async_rename_entities(self, old_id: str, new_id: str) -> None:
+        """Migrate the unique and entity ids of the entities to a new device."""
+        entities: dict[str, Entity] = {}
+        for platform in async_get_platforms(self.hass, DOMAIN):
+            if platform.config_entry is self.config_entry:
+                entities.update(platform.entities)
+
+        entity_registry = er.async_get(self.hass)
+        old_suffix = f"_{old_id}"
+        for registry_entry in er.async_entries_for_config_entry(
+            entity_registry, self.config_entry.entry_id
+        ):
+            if not registry_entry.unique_id.endswith(old_suffix):
+                continue
+            new_unique_id = registry_entry.unique_id.removesuffix(old_suffix)
+            new_unique_id += f"_{new_id}"
+            changes: dict[str, str] = {"new_unique_id": new_unique_id}
+            # Keep entity ids customized by the user
+            if registry_entry.entity_id == (
+                f"{registry_entry.domain}.{registry_entry.unique_id}"
+            ):
+                new_entity_id = f"{registry_entry.domain}.{new_unique_id}"
+                if not entity_registry.async_is_registered(new_entity_id):
+                    changes["new_entity_id"] = new_entity_id
+
+            entity = entities.get(registry_entry.entity_id)
+            if entity is not None:
+                # The live entity is looked up by its new unique id if re-added
+                entity._attr_unique_id = new_unique_id  # noqa: SLF001
+            try:
+                entity_registry.async_update_entity(
+                    registry_entry.entity_id, **changes
+                )
+            except ValueError as err:
+                LOGGER.warning(
+                    "%s: Failed to migrate %s: %s",
+                    new_id,
+                    registry_entry.entity_id,
+                    err,
+                )
+                if entity is not None:
+                    entity._attr_unique_id = registry_entry.unique_id  # noqa: SLF001
+
+    @callback
+    def async_update_device(self) -> None:
+        """Apply the name and species of the config entry to the device."""
+        entry = self.config_entry
+        self.device_info["name"] = entry.title[0].upper() + entry.title[1:]
+        self.device_info["model"] = entry.data.get("species")
+        # Fleet entities show the plant name
+        async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATED, self, self.schedule)
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers=self.device_info["identifiers"]
+        )
+        if device is None:
+            return
+        # The entry title follows names given by the user, see __init__
+        device_registry.async_update_device(
+            device.id,
+            name=self.device_info["name"],
+            name_by_user=None,
+            model=self.device_info["model"],
+        )
 
     async def async_set_last_action_date(self, value: datetime, action: str) -> None:
         """Change last action date manually."""
         new_value = as_utc(value)
-        if new_value > utcnow():
+        if new_value > self.clock.utcnow():
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="invalid_future_date",
                 translation_placeholders={},
             )
-        await self.store.async_save_data(
+        self._async_record_care(action, new_value)
+        if await self.store.async_save_data(
             self.device, {f"{action}": new_value.isoformat()}
+        ):
+            await self.async_refresh()
+
+    @callback
+    def async_care_done_data(
+        self, care_types: Iterable[str], value: datetime
+    ) -> dict[str, str]:
+        """
+        Return the data marking care types as done at `value`, to be stored.
+
+        Counts the care in the statistics, the caller saves the data, with
+        that of other plants.
+        """
+        data: dict[str, str] = {}
+        for care in care_types:
+            last_key, _ = CARE_SCHEDULE_KEYS[care]
+            self._async_record_care(last_key, value)
+            data[last_key] = value.isoformat()
+        return data
+
+    @callback
+    def _async_record_care(self, last_key: str, value: datetime) -> None:
+        """
+        Count a care event in the statistics when a last action date changes.
+
+        Moving the date forward counts an event at `value`, moving it back
+        undoes the last event.
+        """
+        if (care := CARE_TYPES_BY_LAST_KEY.get(last_key)) is None:
+            return
+        old_date = self.dates.get(last_key)
+        new_date = as_local(value).date()
+        if old_date is None or new_date == old_date:
+            return
+        from .statistics import async_get_statistics, care_statistic_id  # noqa: PLC0415
+
+        async_get_statistics(self.hass).async_record(
+            care_statistic_id(self.config_entry.entry_id, care),
+            f"{self.config_entry.title} {care}",
+            value if new_date > old_date else self.clock.utcnow(),
+            1 if new_date > old_date else -1,
         )
-        await self.async_refresh()
 
     async def async_mark_action_toggle(self, action: str) -> None:
         """Toggle last action between old value and today."""
@@ -97,7 +511,7 @@ class SimplePlantExtendedCoordinator(DataUpdateCoordinator[dict]):
                 as_local(datetime.fromisoformat(data[f"_old_last_{action}"]))
             )
 
-        if last_action and as_local(last_action).date() != as_local(utcnow()).date():
+        if last_action and as_local(last_action).date() != self.clock.today():
             await self.async_action_mark_action(save_old=last_action, action=action)
         else:
             await self.async_action_cancel_mark_action(old_value=old_last_action, action=action)
@@ -115,269 +529,230 @@ class SimplePlantExtendedCoordinator(DataUpdateCoordinator[dict]):
         self, save_old: datetime | None = None, action: str = "watered"
     ) -> None:
         """Update last action date today."""
-        today = utcnow()
+        today = self.clock.utcnow()
         if save_old:
             await self.store.async_save_data(
                 self.device, {f"_old_last_{action}": as_utc(save_old).isoformat()}
             )
         await self.async_set_last_action_date(today, f"last_{action}")
 
-    async def get_dates(self) -> dict[str, datetime] | None:
-        """Get dates from relevant device entity states, with retry."""
-
-        states_to_get = {
-            "last_watered": f"date.{DOMAIN}_last_watered_{self.device}",
-            "nb_watered_days": f"number.{DOMAIN}_days_between_waterings_{self.device}",
-            "last_feed": f"sensor.{DOMAIN}_feed_lastfeed_{self.device}",
-            "last_fertilized": f"date.{DOMAIN}_last_fertilized_{self.device}",
-            "nb_fertilized_days": f"number.{DOMAIN}_days_between_fertilizations_{self.device}",
-            "last_misted": f"date.{DOMAIN}_last_misted_{self.device}",
-            "nb_misted_days": f"number.{DOMAIN}_days_between_mistings_{self.device}",
-            "last_cleaned": f"date.{DOMAIN}_last_cleaned_{self.device}",
-            "nb_cleaned_days": f"number.{DOMAIN}_days_between_cleanings_{self.device}",
-        }
-
-        for attempt in range(5):
-            data = {key: self.hass.states.get(eid) for key, eid in states_to_get.items()}
-
-            if all(
-                data[key] is not None and data[key].state not in (None, "", "unknown", "unavailable")
-                for key in states_to_get
-            ):
-                break
-
-            LOGGER.info("%s: Waiting for entity states... (%d)", self.device, attempt + 1)
-            await asyncio.sleep(2)
-        else:
-            LOGGER.warning("%s: Couldn't get all states after retry", self.device)
-            # return None
-
-        states = {key: data[key].state for key in data if data[key] is not None}
-
-        try:
-            last_watered_date = datetime.fromisoformat(states["last_watered"])
-            nb_watered_days = float(states["nb_watered_days"])
-
-            last_fertilized_date = datetime.fromisoformat("1970-01-01")
-            if states["last_fertilized"] not in ["unknown", "", "None"]:
-                last_fertilized_date = datetime.fromisoformat(states["last_fertilized"])
-            nb_fertilized_days = float(states["nb_fertilized_days"]) if float(states["nb_fertilized_days"]) > 0 else 1
-
-            last_misted_date = datetime.fromisoformat("1970-01-01")
-            if states["last_misted"] not in ["unknown", "", "None"]:
-                last_misted_date = datetime.fromisoformat(states["last_misted"])
-            nb_misted_days = float(states["nb_misted_days"]) if float(states["nb_misted_days"]) > 0 else 1
-
-            last_cleaned_date = datetime.fromisoformat("1970-01-01")
-            if states["last_cleaned"] not in ["unknown", "", "None"]:
-                last_cleaned_date = datetime.fromisoformat(states["last_cleaned"])
-            nb_cleaned_days = float(states["nb_cleaned_days"]) if float(states["nb_cleaned_days"]) > 0 else 1
-
-            return {
-                "last_watered": last_watered_date,
-                "next_watering": last_watered_date + timedelta(days=nb_watered_days),
-                "last_fertilized": last_fertilized_date,
-                "next_fertilization": last_fertilized_date + timedelta(days=nb_fertilized_days),
-                "last_misted": last_misted_date,
-                "next_misting": last_misted_date + timedelta(days=nb_misted_days),
-                "last_cleaned": last_cleaned_date,
-                "next_cleaning": last_cleaned_date + timedelta(days=nb_cleaned_days),
-                "today": utcnow(),
-            }
-        except Exception as e:
-            LOGGER.warning("%s: Failed to parse dates: %s", self.device, e)
-            return None
+    @callback
+    def get_dates(self) -> PlantSchedule:
+        """Compute the care schedule of the plant from its stored data."""
+        start = perf_counter_ns()
+        data = self.data or {}
+        entry_data = self.config_entry.data
+        last: dict[str, date] = {}
+        intervals: dict[str, float] = {}
+        next_dates: dict[str, date] = {}
+        for care, (last_key, interval_key) in CARE_SCHEDULE_KEYS.items():
+            if care in self.disabled_care_types:
+                continue
+            last_date = self.dates.get(last_key)
+            if last_date is None:
+                last_date = parse_local_date(
+                    str(entry_data.get(last_key) or "1970-01-01")
+                )
+            last[care] = last_date or date(1970, 1, 1)
+            try:
+                interval = float(
+                    data.get(f"{DOMAIN}_{interval_key}_{self.device}")
+                    or entry_data.get(interval_key)
+                    or 0
+                )
+            except ValueError:
+                interval = 0
+            intervals[care] = interval if interval > 0 else 1
+            next_dates[care] = last[care] + timedelta(days=intervals[care])
+        schedule = PlantSchedule(
+            today=self.clock.today(),
+            last=last,
+            intervals=intervals,
+            next=next_dates,
+        )
+        self.metrics.async_record(METRIC_GET_DATES, perf_counter_ns() - start)
+        return schedule
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Signal the new schedule, then update all registered listeners."""
+        self._async_parse_dates()
+        self._async_update_schedule()
+        super().async_update_listeners()
+
+    @callback
+    def _async_parse_dates(self) -> None:
+        """Parse the stored last action dates, once per data update."""
+        data = self.data or {}
+        dates: dict[str, date] = {}
+        for last_key, _ in CARE_SCHEDULE_KEYS.values():
+            if (value := data.get(last_key)) and (
+                last_date := parse_local_date(value)
+            ) is not None:
+                dates[last_key] = last_date
+        self.dates = dates
+
+    @callback
+    def async_handle_midnight(self, _now: datetime) -> None:
+        """Move the schedule to the new day."""
+        self._async_update_schedule()
+
+    @callback
+    def _async_update_schedule(self) -> None:
+        """Signal the schedule to dependent entities if it changed."""
+        schedule = self.get_dates()
+        if schedule == self.schedule:
+            return
+        self.schedule = schedule
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_SCHEDULE_UPDATED.format(self.config_entry.entry_id),
+            schedule,
+        )
+        async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATED, self, schedule)
 
     async def async_migrate_data(self) -> None:
-        """Migrate data for a device to another name."""
-
-        
-        states_to_get = {
-            "migrate_last_feed_date": f"sensor.{DOMAIN}_feed_lastfeed_{self.device}",
-            "feed_method": f"input_select.{DOMAIN}_feed_method_{self.device}",
-            "feed_interval": f"input_number.{DOMAIN}_feed_interval_{self.device}",
-            "misting_enabled": f"binary_sensor.{DOMAIN}_care_misting_enabled_{self.device}",
-            "misting_interval": f"input_number.{DOMAIN}_care_mist_interval_{self.device}",
-            "cleaning_enabled": f"binary_sensor.{DOMAIN}_care_cleaning_enabled_{self.device}",
-            "cleaning_interval": f"input_number.{DOMAIN}_care_clean_interval_{self.device}",
-            "next_misting": f"sensor.{DOMAIN}_care_next_misting_{self.device}",
-            "next_cleaning": f"sensor.{DOMAIN}_care_next_cleaning_{self.device}",
+        """Migrate the data of the legacy entities of the plant."""
+        await async_migrate_legacy_data([self])
+
+    @callback
+    def async_legacy_data(self) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """
+        Return the data of the legacy entities of the plant, to be stored.
+
+        Reads the states left by the legacy integration, returning the data to
+        store and a report of the migrated values and errors. Returns None if
+        some legacy entity is missing.
+        """
+        states = {
+            key: self.hass.states.get(entity_id.format(DOMAIN, self.device))
+            for key, entity_id in LEGACY_ENTITY_IDS.items()
         }
-
-        # Get states from hass
-        data = {key: self.hass.states.get(eid) for key, eid in states_to_get.items()}
-
-        # Check if all states are available
         if any(
-            data[key] is None
-            or not data[key].state  # type: ignore noqa: PGH003
-            or data[key].state == "unavailable"  # type: ignore noqa: PGH003
-            for key in states_to_get
+            state is None or state.state in ("", "unavailable")
+            for state in states.values()
         ):
-            
             return None
-
-        states = {key: data.state for key, data in data.items() if data is not None}
-        response = {
-            "status": "success",
-            "data": states,
+        values = {
+            key: state.state
+            for key, state in states.items()
+            if state is not None and state.state not in LEGACY_UNSET
         }
-
-        feed_actions = ["feed"]
-        for action in feed_actions:
-            last_action = states["migrate_last_feed_date"]
-            method = states["feed_method"]
-            interval = float(states["feed_interval"])
-            response["feed"] = { "message": f"{self.device} migrating feed data"}
-            
-            if last_action not in [None, "None", "unknown", "unavailable"]:
-                try:
-                    dt = datetime.fromisoformat(str(last_action))
-                    iso_date = dt.date().isoformat()
-
-                    response["feed"]["last_action"] = await self.store.async_save_data(
-                        self.device,
-                        {"last_fertilized": iso_date},
-                    )
-
-                    iso_next_date = (dt + timedelta(days=round(interval))).date().isoformat()
-
-                    response["feed"]["next_date"] = await self.store.async_save_data(
-                        self.device,
-                        {"next_fertilization": iso_next_date},
-                    )
-
-                except Exception as e:
-                    response["status"] = "error"
-                    response["error"] = str(e)
-                    LOGGER.error("%s: Failed to convert feed date: %s", self.device, response)
-            else:
-                response["feed"]["last_action"] = {"message": "No last feed date to migrate"}
-                
-            if method not in [None, "None", "unknown", "unavailable"]:
-                try:
-                    feed_method_store = await self.store.async_save_data(
-                        self.device,
-                        {"feed_method": method},
-                    )
-
-                    feed_method__sync = await self.hass.services.async_call(
-                        "select",
-                        "select_option",
-                        {
-                            "entity_id": f"select.{DOMAIN}_feed_method_{self.device}",
-                            "option": method,
-                        },
-                        blocking=True,
-                    )
-                    response["feed"]["method"] = f"{feed_method_store} \n {feed_method__sync}"
-
-                except Exception as e:
-                    response["status"] = "error"
-                    response["error"] = str(e)
-                    LOGGER.error("%s: Failed to migrate feed method: %s", self.device, response)
+        data: dict[str, Any] = {}
+        report: dict[str, Any] = {"status": "migrated", "values": {}, "errors": {}}
+        for key, options in PLANT_SETTINGS.items():
+            if key not in values:
+                continue
+            if values[key] in options:
+                data[f"{DOMAIN}_{key}_{self.device}"] = values[key]
+                report["values"][key] = values[key]
             else:
-                response["feed"]["method"] = {"message": "No feed method to migrate"}
-
-        
-            if interval not in [None, "None", "unknown", "unavailable"]:
-                try:
-                    interval_store = await self.store.async_save_data(
-                        self.device,
-                        {"days_between_fertilizations": interval},
+                report["errors"][key] = f"Invalid option {values[key]}"
+        intervals: dict[str, float] = {}
+        for care, (last_key, interval_key) in CARE_SCHEDULE_KEYS.items():
+            try:
+                if interval_key in values:
+                    intervals[care] = float(values[interval_key])
+                    data[f"{DOMAIN}_{interval_key}_{self.device}"] = str(
+                        intervals[care]
                     )
-                    interval_sync = await self.hass.services.async_call(
-                        "number",
-                        "set_value",
-                        {
-                            "entity_id": f"number.{DOMAIN}_days_between_fertilizations_{self.device}",
-                            "value": interval,
-                        },
-                        blocking=True,
+                    report["values"][interval_key] = intervals[care]
+                if last_key in values:
+                    last = datetime.fromisoformat(values[last_key]).date()
+                elif (next_key := f"next_{care}") in values and care in intervals:
+                    last = datetime.fromisoformat(values[next_key]).date() - timedelta(
+                        days=round(intervals[care])
                     )
-                    response["feed"]["interval"] = f"{interval_store} \n {interval_sync}"
-                    # await self.async_set_last_action_date(iso_date, "last_fertilized")
+                else:
+                    continue
+                data[last_key] = as_utc(start_of_local_day(last)).isoformat()
+                report["values"][last_key] = last.isoformat()
+            except ValueError as err:
+                report["errors"][care] = str(err)
+        if report["errors"]:
+            report["status"] = "error"
+        return data, report
+
+
+async def async_mark_care_done(
+    coordinators: Iterable[SimplePlantExtendedCoordinator],
+    care_types: Iterable[str],
+    value: datetime,
+) -> None:
+    """
+    Mark care types of many plants as done at `value`.
+
+    All plants are saved in a single store write, then updated in the same
+    loop iteration, so the fleet, calendar and todo list update once.
+    """
+    coordinators = list(coordinators)
+    if not coordinators:
+        return
+    store = coordinators[0].store
+    if value > coordinators[0].clock.utcnow():
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_future_date",
+            translation_placeholders={},
+        )
+    changed = await store.async_save_devices(
+        {
+            coordinator.device: coordinator.async_care_done_data(care_types, value)
+            for coordinator in coordinators
+        }
+    )
+    for coordinator in coordinators:
+        if coordinator.device in changed:
+            coordinator.async_set_updated_data(
+                await store.async_get_data(coordinator.device)
+            )
 
-                except Exception as e:
-                    response["status"] = "error"
-                    response["error"] = str(e)
-                    LOGGER.error("%s: Failed to migrate feed interval: %s", self.device, response)
-            else:
-                response["feed"]["interval"] = {"message": "No feed interval to migrate"}
-
-        care_actions = ["misting", "cleaning"]
-        for action in care_actions:
-            enabled = states[f"{action}_enabled"]
-            interval = float(states[f"{action}_interval"])
-            next_action = states[f"next_{action}"]
-            response[f"{action}"] = {"message": f"{self.device} migrating care data"}
-
-            if enabled not in [None, "None", "unknown", "unavailable"]:
-                try:
-                    enabled_store = await self.store.async_save_data(
-                        self.device,
-                        {f"{action}_enabled": enabled},
-                    )
 
-                    enabled_sync = await self.hass.services.async_call(
-                        "select",
-                        "select_option",
-                        {
-                            "entity_id": f"select.{DOMAIN}_{action}_enabled_{self.device}",
-                            "option": enabled,
-                        },
-                        blocking=True,
-                    )
-                    response[f"{action}"]["enabled"] = f"{enabled_store} \n {enabled_sync}"
-                except Exception as e:
-                    response["status"] = "error"
-                    response["error"] = str(e)
-                    LOGGER.error("%s: Failed to migrate %s enabled: %s", self.device, action, response)
-            else:
-                response[f"{action}"]["enabled"] = {"message": "No enabled state to migrate"}
-            
-            if interval not in [None, "None", "unknown", "unavailable"]:
-                try:
-                    interval_store = await self.store.async_save_data(
-                        self.device,
-                        {f"days_between_{action}s": interval},
-                    )
-                    interval_sync = await self.hass.services.async_call(
-                        "number",
-                        "set_value",
-                        {
-                            "entity_id": f"number.{DOMAIN}_days_between_{action}s_{self.device}",
-                            "value": interval,
-                        },
-                        blocking=True,
-                    )
-                    response[f"{action}"]["interval"] = f"{interval_store} \n {interval_sync}"
-                except Exception as e:
-                    response["status"] = "error"
-                    response["error"] = str(e)
-                    LOGGER.error("%s: Failed to migrate %s interval: %s", self.device, action, response)
-            else:
-                response[f"{action}"]["interval"] = {"message": "No interval state to migrate"}
-
-            if next_action not in [None, "None", "unknown", "unavailable"]:
-                try:
-                    dt = datetime.fromisoformat(str(next_action))
-                    iso_date = (dt - timedelta(days=round(interval))).date().isoformat()
-                    action_type = None
-                    if "clean" in action:
-                        action_type = "cleaned"
-                    else:
-                        action_type = "misted"
-
-                    response[f"{action}"]["next_date"] = await self.store.async_save_data(
-                        self.device,
-                        {f"last_{action_type}": iso_date},
-                    )
-                except Exception as e:
-                    response["status"] = "error"
-                    response["error"] = str(e)
-                    LOGGER.error("%s: Failed to migrate last %s date: %s", self.device, action, response)
-            else:
-                response[f"{action}"]["next_date"] = {"message": "No last date state to migrate"}
-        await self.async_refresh()
-        LOGGER.warning("%s: Finished Migrating data:\n\n %s", self.device, response)
+async def async_migrate_legacy_data(
+    coordinators: Iterable[SimplePlantExtendedCoordinator],
+    batch_size: int = MIGRATION_BATCH_SIZE,
+) -> dict[str, Any]:
+    """
+    Migrate the data of the legacy entities of many plants.
+
+    Plants are migrated `batch_size` at a time: each batch is saved in a
+    single store write, then its plants and their entities are updated at
+    once. Returns the counts of migrated, skipped and failed plants, with the
+    report of each plant by title.
+    """
+    coordinators = list(coordinators)
+    results: dict[str, Any] = {}
+    for start in range(0, len(coordinators), batch_size):
+        batch = coordinators[start : start + batch_size]
+        changes: dict[str, dict[str, Any]] = {}
+        for coordinator in batch:
+            title = coordinator.config_entry.title
+            if (legacy := coordinator.async_legacy_data()) is None:
+                results[title] = {"status": "skipped"}
+                continue
+            changes[coordinator.device], results[title] = legacy
+        if not changes:
+            continue
+        changed = await batch[0].store.async_save_devices(changes)
+        for coordinator in batch:
+            if coordinator.device not in changed:
+                continue
+            values = results[coordinator.config_entry.title]["values"]
+            for care, key in OPTIONAL_CARE_TYPES.items():
+                if key in values:
+                    coordinator.async_set_care_type_enabled(care, values[key] != "off")
+            coordinator.async_set_updated_data(
+                await coordinator.store.async_get_data(coordinator.device)
+            )
+        LOGGER.info(
+            "Migrated legacy data of %d of %d plants",
+            min(start + batch_size, len(coordinators)),
+            len(coordinators),
+        )
+    statuses = Counter(result["status"] for result in results.values())
+    return {
+        "migrated": statuses["migrated"],
+        "skipped": statuses["skipped"],
+        "failed": statuses["error"],
+        "plants": results,
+    }
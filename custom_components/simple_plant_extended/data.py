@@ -1,14 +1,19 @@
 """Storage helper for simple_plant_extended."""
 
+from collections.abc import Mapping
+from time import perf_counter_ns
 from typing import Any, ClassVar
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 
-from .const import LOGGER, STORAGE_KEY
+from .const import LOGGER, METRIC_LOAD, METRIC_SAVE_DATA, STORAGE_KEY
 
 STORAGE_VERSION = 1
 
+_MISSING = object()
+
 
 class SimplePlantExtendedStore:
     """
@@ -29,14 +34,19 @@ class SimplePlantExtendedStore:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the storage."""
         if not self._initialized:
+            from .metrics import async_get_metrics  # noqa: PLC0415
+
             LOGGER.debug("Initializing storage %s", STORAGE_KEY)
+            self.metrics = async_get_metrics(hass)
             self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
             self._data: dict[str, Any] | None = None
             self._initialized = True
 
     async def async_load(self) -> None:
         """Load the data from storage."""
+        start = perf_counter_ns()
         self._data = await self.store.async_load() or {}
+        self.metrics.async_record(METRIC_LOAD, perf_counter_ns() - start)
 
     async def async_get_data(self, device: str) -> dict[str, Any]:
         """Get data from storage."""
@@ -47,20 +57,55 @@ class SimplePlantExtendedStore:
             return {}
         return self._data.get(device, {})
 
-    async def async_save_data(self, device: str, data: dict) -> None:
-        """Save data to storage."""
+    async def async_save_data(self, device: str, data: dict) -> bool:
+        """
+        Save data to storage.
+
+        Returns false, without writing anything, if `data` is already stored.
+        """
+        return bool(await self.async_save_devices({device: data}))
+
+    async def async_save_devices(self, data: Mapping[str, dict]) -> set[str]:
+        """
+        Save data of many devices to storage, in a single write.
+
+        Returns the devices whose data changed, nothing is written if none did.
+        """
         if self._data is None:
             await self.async_load()
         if self._data is None:  # for linting
             LOGGER.error("Failed to load data from storage")
-            return
-        device_data = self._data.get(device, {})
-        # update data
-        device_data.update(data)
-        self._data[device] = device_data
+            return set()
+        changed = set()
+        for device, device_changes in data.items():
+            device_data = self._data.get(device, {})
+            if all(
+                device_data.get(key, _MISSING) == value
+                for key, value in device_changes.items()
+            ):
+                LOGGER.debug("Data of device %s unchanged", device)
+                continue
+            # update data
+            device_data.update(device_changes)
+            self._data[device] = device_data
+            changed.add(device)
+            LOGGER.debug(
+                "Storing following data to device %s : %s", device, device_changes
+            )
+        if not changed:
+            self.metrics.avoided_writes += 1
+            LOGGER.debug(
+                "Data unchanged, skipping write (%d avoided)",
+                self.metrics.avoided_writes,
+            )
+            return changed
         # store data
-        LOGGER.debug("Storing following data to device %s : %s", device, data)
+        start = perf_counter_ns()
         await self.store.async_save(self._data)
+        self.metrics.async_record(METRIC_SAVE_DATA, perf_counter_ns() - start)
+        if self.metrics.count_bytes:
+            self.metrics.paths[METRIC_SAVE_DATA].bytes += len(json_bytes(self._data))
+        return changed
 
     async def async_remove_device(self, device: str) -> None:
         """Remove device data from storage."""
@@ -9,11 +9,13 @@ from homeassistant.components.date import (
     DateEntity,
     DateEntityDescription,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import as_local, as_utc
 
 from .const import DOMAIN
 from .coordinator import SimplePlantExtendedCoordinator
+from .entity import SimplePlantExtendedEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -51,13 +53,21 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the date platform."""
-    async_add_entities(
-        SimplePlantExtendedDate(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
+    coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_add_platform_entities(
+        async_add_entities,
+        lambda: (
+            SimplePlantExtendedDate(hass, entry, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
+        ),
     )
 
 
-class SimplePlantExtendedDate(CoordinatorEntity[SimplePlantExtendedCoordinator], DateEntity):
+class SimplePlantExtendedDate(
+    SimplePlantExtendedEntity,
+    CoordinatorEntity[SimplePlantExtendedCoordinator],
+    DateEntity,
+):
     """simple_plant_extended date class."""
 
     _attr_has_entity_name = True
@@ -79,6 +89,8 @@ class SimplePlantExtendedDate(CoordinatorEntity[SimplePlantExtendedCoordinator],
             datetime.fromisoformat(str(entry.data.get(description.key, "1970-01-01")))
         ).date()
 
+        self._written_value: date | None = None
+
         self.entity_id = f"date.{DOMAIN}_{description.key}_{device}"
         self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
 
@@ -103,14 +115,16 @@ class SimplePlantExtendedDate(CoordinatorEntity[SimplePlantExtendedCoordinator],
         new_val = as_utc(as_local(dt))
         await self.coordinator.async_set_last_action_date(new_val, self.entity_description.key)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the date changed."""
+        value = self.native_value
+        if value == self._written_value:
+            return
+        self._written_value = value
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> date | None:
-        """Return the date value."""
-        if not self.coordinator.data:
-            return None
-
-        date_str = self.coordinator.data.get(self.entity_description.key)
-        if not date_str:
-            return None
-
-        return as_local(datetime.fromisoformat(date_str)).date()
+        """Return the date value, parsed by the coordinator."""
+        return self.coordinator.dates.get(self.entity_description.key)
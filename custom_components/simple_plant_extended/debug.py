@@ -0,0 +1,139 @@
+"""Debug mode of simple_plant_extended, logging the slow steps of the loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+
+from .const import DATA_DEBUG, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import Event, HomeAssistant
+
+# Directory of the integration, to find its frames in a stack
+INTEGRATION_DIR = str(Path(__file__).parent) + os.sep
+
+# Frames of a stack logged with a slow step
+STACK_LIMIT = 12
+
+
+class SimplePlantExtendedDebugMonitor:
+    """
+    Time the steps of the event loop and log those the integration held too long.
+
+    Every step of the loop, the run of a callback or of a task until its next
+    await, is timed. A watchdog thread takes the stack of the loop once a step
+    runs longer than the threshold: when a frame of the integration is in it,
+    the step is logged with that stack, once per place in the integration.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize the monitor, `threshold` in seconds."""
+        self.threshold = threshold
+        self.steps = 0
+        self.slow_steps = 0
+        # Logged steps by place in the integration
+        self.reports: dict[tuple[str, int], str] = {}
+        self._loop_thread: int | None = None
+        self._step_start: float | None = None
+        self._step_stack: tuple[float, traceback.StackSummary] | None = None
+        self._stopped = threading.Event()
+        self._watchdog: threading.Thread | None = None
+        self._handle_run: Callable[[asyncio.Handle], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start timing the steps of the loop."""
+        self._loop_thread = threading.get_ident()
+        handle_run = self._handle_run = asyncio.events.Handle._run  # noqa: SLF001
+        monitor = self
+
+        def _run(handle: asyncio.Handle) -> None:
+            monitor._step_start = start = time.perf_counter()  # noqa: SLF001
+            try:
+                handle_run(handle)
+            finally:
+                monitor._step_start = None  # noqa: SLF001
+                monitor._end_step(handle, time.perf_counter() - start, start)  # noqa: SLF001
+
+        asyncio.events.Handle._run = _run  # noqa: SLF001
+        self._watchdog = threading.Thread(
+            target=self._watch, name=f"{DOMAIN}_debug", daemon=True
+        )
+        self._watchdog.start()
+        LOGGER.warning(
+            "Debug mode: logging the loop steps held longer than %.0f ms",
+            self.threshold * 1000,
+        )
+
+    async def async_stop(self, hass: HomeAssistant) -> None:
+        """Stop timing the steps of the loop."""
+        if self._handle_run is not None:
+            asyncio.events.Handle._run = self._handle_run  # noqa: SLF001
+            self._handle_run = None
+        self._stopped.set()
+        if self._watchdog is not None:
+            await hass.async_add_executor_job(self._watchdog.join)
+            self._watchdog = None
+
+    def _watch(self) -> None:
+        """Take the stack of the loop once a step runs longer than the threshold."""
+        while not self._stopped.wait(self.threshold / 4):
+            start = self._step_start
+            if (
+                start is None
+                or time.perf_counter() - start < self.threshold
+                or (self._step_stack is not None and self._step_stack[0] == start)
+            ):
+                continue
+            if (frame := sys._current_frames().get(self._loop_thread)) is not None:  # noqa: SLF001
+                self._step_stack = (start, traceback.extract_stack(frame))
+
+    def _end_step(self, handle: asyncio.Handle, duration: float, start: float) -> None:
+        """Log the step if it held the loop too long in the integration."""
+        self.steps += 1
+        if duration < self.threshold:
+            return
+        self.slow_steps += 1
+        if self._step_stack is None or self._step_stack[0] != start:
+            return
+        stack = self._step_stack[1]
+        place = next(
+            (
+                frame
+                for frame in reversed(stack)
+                if frame.filename.startswith(INTEGRATION_DIR)
+            ),
+            None,
+        )
+        if place is None or (place.filename, place.lineno) in self.reports:
+            return
+        report = f"Step held the loop {duration * 1000:.0f} ms: {handle!r}\n" + "".join(
+            traceback.format_list(stack[-STACK_LIMIT:])
+        )
+        self.reports[place.filename, place.lineno] = report
+        LOGGER.warning(report)
+
+
+@callback
+def async_setup_debug(hass: HomeAssistant, threshold: float) -> None:
+    """Start the debug mode, until Home Assistant stops."""
+    monitor = SimplePlantExtendedDebugMonitor(threshold)
+    hass.data[DATA_DEBUG] = monitor
+    monitor.async_start()
+
+    async def _async_stop(_event: Event) -> None:
+        await monitor.async_stop(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_stop)
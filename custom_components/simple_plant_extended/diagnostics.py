@@ -0,0 +1,86 @@
+"""Diagnostics support for simple_plant_extended."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.dispatcher import DATA_DISPATCHER
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN, PLANT_SETTINGS
+from .coordinator import CARE_SCHEDULE_KEYS, SIGNAL_SCHEDULE_UPDATED
+from .metrics import async_get_metrics
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SimplePlantExtendedCoordinator
+
+
+def _live_keys(device: str) -> set[str]:
+    """Return the stored keys of a plant that are still read."""
+    keys: set[str] = set()
+    for last_key, interval_key in CARE_SCHEDULE_KEYS.values():
+        keys |= {last_key, f"_old_{last_key}", f"{DOMAIN}_{interval_key}_{device}"}
+    keys |= {f"{DOMAIN}_{setting}_{device}" for setting in PLANT_SETTINGS}
+    return keys
+
+
+def _photo_footprint(hass: HomeAssistant, paths: list[str]) -> dict[str, int]:
+    """Add up the size of photo files from their url paths, in the executor."""
+    size = 0
+    missing = 0
+    for path in paths:
+        try:
+            size += Path(hass.config.path(path.lstrip("/"))).stat().st_size
+        except OSError:
+            missing += 1
+    return {"files": len(paths), "bytes": size, "missing": missing}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """
+    Return diagnostics for a plant.
+
+    Sizes its stored record and photos, and lists the recent refresh
+    durations and the listeners of the plant, next to the hot path metrics of
+    all plants.
+    """
+    diagnostics: dict[str, Any] = {"config_entry": entry.as_dict()}
+    coordinator: SimplePlantExtendedCoordinator | None = hass.data[DOMAIN].get(
+        entry.entry_id
+    )
+    if coordinator is None:
+        return diagnostics
+
+    record = await coordinator.store.async_get_data(coordinator.device)
+    diagnostics["store"] = {
+        "device": coordinator.device,
+        "bytes": len(json_bytes(record)),
+        "keys": len(record),
+        "dead_keys": sorted(record.keys() - _live_keys(coordinator.device)),
+    }
+    diagnostics["refresh_ms"] = list(coordinator.refresh_durations)
+    dispatcher = hass.data.get(DATA_DISPATCHER, {})
+    diagnostics["listeners"] = {
+        "coordinator": len(coordinator._listeners),  # noqa: SLF001
+        "schedule": len(
+            dispatcher.get(SIGNAL_SCHEDULE_UPDATED.format(entry.entry_id), {})
+        ),
+    }
+    paths = coordinator.photos.paths
+    paths += [
+        path
+        for key in ("photo", "photo_original")
+        if (path := entry.data.get(key)) and path not in paths
+    ]
+    diagnostics["photos"] = await hass.async_add_executor_job(
+        _photo_footprint, hass, paths
+    )
+    diagnostics["schedule"] = coordinator.schedule
+    diagnostics["metrics"] = async_get_metrics(hass).async_snapshot()
+    return diagnostics
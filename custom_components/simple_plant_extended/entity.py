@@ -0,0 +1,23 @@
+"""Base entity of simple_plant_extended."""
+
+from __future__ import annotations
+
+from time import perf_counter_ns
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+
+from .metrics import METRIC_STATE_WRITE, async_get_metrics
+
+
+class SimplePlantExtendedEntity(Entity):
+    """Base of the simple_plant_extended entities, timing their state writes."""
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine, counting it in the metrics."""
+        start = perf_counter_ns()
+        super().async_write_ha_state()
+        async_get_metrics(self.hass).async_record(
+            METRIC_STATE_WRITE, perf_counter_ns() - start
+        )
@@ -0,0 +1,178 @@
+"""Running care counters of all plants for simple_plant_extended."""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .clock import async_get_clock
+from .const import DATA_FLEET, DOMAIN
+from .coordinator import CARE_SCHEDULE_KEYS, SIGNAL_FLEET_UPDATED
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .coordinator import PlantSchedule, SimplePlantExtendedCoordinator
+
+# Lowest number of days overdue in each bucket of the histogram
+HISTOGRAM_BUCKETS = (1, 2, 4, 8, 15, 31)
+
+
+class SimplePlantExtendedFleet:
+    """
+    Care counters of all plants, kept up to date as schedules change.
+
+    Each care type of each plant counts once, at its next date. A change
+    only moves the counts of that plant, and a new day only moves the counts
+    of the dates crossing a boundary, so nothing iterates over all plants.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the counters."""
+        self.hass = hass
+        self.today: date = async_get_clock(hass).today()
+        self.next_dates: dict[tuple[str, str], date] = {}
+        self.due_today: Counter[str] = Counter()
+        self.overdue: Counter[str] = Counter()
+        self.histogram = [0] * len(HISTOGRAM_BUCKETS)
+        self._by_date: defaultdict[str, Counter[date]] = defaultdict(Counter)
+        # Next dates pushed as (date, entry id, care), outdated ones are
+        # dropped when they reach the top
+        self._heap: list[tuple[date, str, str]] = []
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._update_scheduled = False
+
+    @callback
+    def async_setup(self) -> None:
+        """Count the loaded plants, then follow their schedules."""
+        coordinators: dict[str, SimplePlantExtendedCoordinator] = self.hass.data[DOMAIN]
+        for coordinator in coordinators.values():
+            self._update_plant(coordinator, coordinator.schedule)
+        async_dispatcher_connect(
+            self.hass, SIGNAL_FLEET_UPDATED, self._async_handle_fleet
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for counter updates."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_handle_fleet(
+        self,
+        coordinator: SimplePlantExtendedCoordinator,
+        schedule: PlantSchedule | None,
+    ) -> None:
+        """Count the new schedule of a plant, updating once per loop iteration."""
+        changed = False
+        if schedule is not None and schedule.today > self.today:
+            self._roll_over(schedule.today)
+            changed = True
+        changed = self._update_plant(coordinator, schedule) or changed
+        if not changed and (most_overdue := self.most_overdue()) is not None:
+            # Renames change the name of the most overdue plant
+            changed = most_overdue[1] == coordinator.config_entry.entry_id
+        if changed and not self._update_scheduled:
+            self._update_scheduled = True
+            self.hass.loop.call_soon(self._async_update_listeners)
+
+    @callback
+    def _async_update_listeners(self) -> None:
+        """Update all listeners."""
+        self._update_scheduled = False
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _update_plant(
+        self,
+        coordinator: SimplePlantExtendedCoordinator,
+        schedule: PlantSchedule | None,
+    ) -> bool:
+        """Move the counts of a plant to its new schedule."""
+        entry_id = coordinator.config_entry.entry_id
+        next_dates = {} if schedule is None else schedule.next
+        changed = False
+        for care in CARE_SCHEDULE_KEYS:
+            key = (entry_id, care)
+            old_date = self.next_dates.get(key)
+            new_date = next_dates.get(care)
+            if old_date == new_date:
+                continue
+            changed = True
+            if old_date is not None:
+                del self.next_dates[key]
+                self._count(care, old_date, -1)
+            if new_date is not None:
+                self.next_dates[key] = new_date
+                self._count(care, new_date, 1)
+                heapq.heappush(self._heap, (new_date, entry_id, care))
+        return changed
+
+    def _count(self, care: str, next_date: date, count: int) -> None:
+        """Add `count` care at `next_date` to the counters."""
+        counts = self._by_date[care]
+        counts[next_date] += count
+        if not counts[next_date]:
+            del counts[next_date]
+        days = (self.today - next_date).days
+        if days == 0:
+            self.due_today[care] += count
+        elif days > 0:
+            self.overdue[care] += count
+            self.histogram[bisect_right(HISTOGRAM_BUCKETS, days) - 1] += count
+
+    def _roll_over(self, today: date) -> None:
+        """Move the counters to a new day."""
+        while self.today < today:
+            yesterday = self.today
+            self.today = yesterday + timedelta(days=1)
+            for care, counts in self._by_date.items():
+                self.due_today[care] = counts[self.today]
+                self.overdue[care] += counts[yesterday]
+                self.histogram[0] += counts[yesterday]
+                # Care reaching the lowest day count of a bucket moves into it
+                for bucket, days in enumerate(HISTOGRAM_BUCKETS[1:], 1):
+                    moved = counts[yesterday - timedelta(days=days - 1)]
+                    self.histogram[bucket - 1] -= moved
+                    self.histogram[bucket] += moved
+
+    def most_overdue(self) -> tuple[date, str, str] | None:
+        """Return the (next date, entry id, care) that is the most overdue."""
+        heap = self._heap
+        while heap and self.next_dates.get((heap[0][1], heap[0][2])) != heap[0][0]:
+            heapq.heappop(heap)
+        if len(heap) > 2 * len(self.next_dates) + 64:
+            heap[:] = [
+                (next_date, entry_id, care)
+                for (entry_id, care), next_date in self.next_dates.items()
+            ]
+            heapq.heapify(heap)
+        if not heap or heap[0][0] >= self.today:
+            return None
+        return heap[0]
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> SimplePlantExtendedFleet:
+    """Get the care counters of all plants, creating them on first use."""
+    if (fleet := hass.data.get(DATA_FLEET)) is not None:
+        return fleet
+
+    fleet = SimplePlantExtendedFleet(hass)
+    hass.data[DATA_FLEET] = fleet
+    fleet.async_setup()
+    return fleet
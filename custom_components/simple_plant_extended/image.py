@@ -10,8 +10,11 @@ from homeassistant.components.image import (
     ImageEntity,
     ImageEntityDescription,
 )
+from homeassistant.core import callback
+from homeassistant.util.dt import utcnow
 
 from .const import DOMAIN, IMAGES_MIME_TYPES, LOGGER
+from .entity import SimplePlantExtendedEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -42,7 +45,7 @@ async def async_setup_entry(
     )
 
 
-class SimplePlantExtendedImage(ImageEntity):
+class SimplePlantExtendedImage(SimplePlantExtendedEntity, ImageEntity):
     """simple_plant_extended image class."""
 
     _attr_has_entity_name = True
@@ -61,10 +64,8 @@ class SimplePlantExtendedImage(ImageEntity):
 
         device = self.coordinator.device
 
-        image_path = str(entry.data.get("photo"))
-        self._attr_image_url = hass.config.path(image_path.lstrip("/"))
-
-        self._attr_content_type = self._get_content_type(Path(image_path))
+        image_path = self.coordinator.photos.latest or entry.data.get("photo")
+        self._set_image_path(image_path)
 
         self.entity_id = f"image.{DOMAIN}_{description.key}_{device}"
         self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
@@ -77,6 +78,27 @@ class SimplePlantExtendedImage(ImageEntity):
         """Return the device name."""
         return self.coordinator.device
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.photos.async_add_listener(self._handle_photo_added)
+        )
+
+    @callback
+    def _handle_photo_added(self) -> None:
+        """Show the latest photo of the timeline."""
+        self._set_image_path(self.coordinator.photos.latest)
+        self._attr_image_last_updated = utcnow()
+        self.async_write_ha_state()
+
+    def _set_image_path(self, image_path: str | None) -> None:
+        """Point the entity to the photo at url path `image_path`."""
+        image_path = str(image_path)
+        hass = self.coordinator.hass
+        self._attr_image_url = hass.config.path(image_path.lstrip("/"))
+        self._attr_content_type = self._get_content_type(Path(image_path))
+
     def _get_content_type(self, path: Path) -> str:
         """Get the content type of the image based on its extension."""
         if path.suffix in IMAGES_MIME_TYPES:
@@ -85,9 +107,9 @@ class SimplePlantExtendedImage(ImageEntity):
 
     async def async_image(self) -> bytes | None:
         """Return bytes of image."""
-        file_path = Path(str(self._attr_image_url))
-        if file_path.exists():
-            async with aiofiles.open(file_path, mode="rb") as file:
+        try:
+            async with aiofiles.open(str(self._attr_image_url), mode="rb") as file:
                 return await file.read()
-        LOGGER.error("Image file not found")
+        except FileNotFoundError:
+            LOGGER.error("Image file not found")
         return None
@@ -0,0 +1,281 @@
+"""Bulk import of plants for simple_plant_extended."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import slugify
+from homeassistant.util.dt import as_utc, start_of_local_day
+from homeassistant.util.ulid import ulid_now
+
+from .clock import async_get_clock
+from .const import (
+    DOMAIN,
+    ENABLED_OPTIONS,
+    FEED_OPTIONS,
+    HEALTH_OPTIONS,
+    ILLUMINATION_OPTIONS,
+    IMPORT_BATCH_SIZE,
+    LOGGER,
+    PHOTO_FORMATS,
+    PLANT_SETTINGS,
+)
+from .coordinator import CARE_SCHEDULE_KEYS
+from .data import SimplePlantExtendedStore
+from .photo import PhotoSettings, async_store_photo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+    from homeassistant.core import HomeAssistant
+
+# Characters read at a time from a JSON file
+JSON_CHUNK_SIZE = 64 * 1024
+
+_INTERVAL = vol.All(vol.Coerce(float), vol.Range(min=1, max=360))
+_LAST_DATE = vol.All(cv.date, date.isoformat)
+
+# A row of an import file, with the fields of the config flow. The photo is
+# the path of a local file.
+IMPORT_ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): vol.All(cv.string, vol.Length(min=1)),
+        vol.Optional("species", default="notset"): cv.string,
+        vol.Optional("photo", default=""): cv.string,
+        vol.Required("last_watered"): _LAST_DATE,
+        vol.Required("days_between_waterings"): _INTERVAL,
+        vol.Required("fertilization_method"): vol.In(FEED_OPTIONS),
+        vol.Required("last_fertilized"): _LAST_DATE,
+        vol.Required("days_between_fertilizations"): _INTERVAL,
+        vol.Required("misting_enabled"): vol.In(ENABLED_OPTIONS),
+        vol.Required("last_misted"): _LAST_DATE,
+        vol.Optional("days_between_mistings"): _INTERVAL,
+        vol.Required("cleaning_enabled"): vol.In(ENABLED_OPTIONS),
+        vol.Required("last_cleaned"): _LAST_DATE,
+        vol.Optional("days_between_cleanings"): _INTERVAL,
+        vol.Required("illumination"): vol.In(ILLUMINATION_OPTIONS),
+        vol.Required("health"): vol.In(HEALTH_OPTIONS),
+        vol.Optional("photo_format"): vol.In(PHOTO_FORMATS),
+        vol.Optional("photo_quality"): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=100)
+        ),
+        vol.Optional("photo_max_size"): vol.All(
+            vol.Coerce(int), vol.Range(min=256, max=8192)
+        ),
+        vol.Optional("photo_keep_original"): cv.boolean,
+        vol.Optional("compact", default=False): cv.boolean,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+def iter_csv_rows(file: TextIO) -> Iterator[dict[str, Any]]:
+    """Yield the rows of a CSV file with a header line."""
+    yield from csv.DictReader(file)
+
+
+def iter_json_rows(file: TextIO) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array, reading the file a chunk at a time.
+
+    Only the item being decoded is held in memory, not the whole file.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+
+    def next_char() -> str:
+        """Return the next character that isn't whitespace, reading on."""
+        nonlocal buffer, position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            buffer, position = file.read(JSON_CHUNK_SIZE), 0
+            if not buffer:
+                return ""
+
+    if next_char() != "[":
+        msg = "Expected a JSON array of plants"
+        raise ValueError(msg)
+    position += 1
+    if next_char() == "]":
+        return
+    while True:
+        next_char()
+        try:
+            item, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as err:
+            # The item goes on in the next chunk
+            if not (chunk := file.read(JSON_CHUNK_SIZE)):
+                msg = f"Invalid JSON: {err}"
+                raise ValueError(msg) from err
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield item
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            msg = f"Expected , or ] after plant {item!r:.40}"
+            raise ValueError(msg)
+        position += 1
+
+
+# Row readers by file suffix
+ROW_READERS = {
+    ".csv": iter_csv_rows,
+    ".json": iter_json_rows,
+}
+
+
+def read_batch(rows: Iterator[Any], size: int) -> list[Any]:
+    """Read the next `size` rows, in the executor."""
+    return list(islice(rows, size))
+
+
+def initial_data(device: str, plant: dict[str, Any]) -> dict[str, str]:
+    """
+    Return the stored data of a new plant, as its entities store it.
+
+    The date, number and select entities of a plant store their config entry
+    values on their first setup, one write each. Storing them beforehand
+    makes these writes no-ops.
+    """
+    data = {}
+    for last_key, interval_key in CARE_SCHEDULE_KEYS.values():
+        day = date.fromisoformat(plant[last_key])
+        data[last_key] = as_utc(start_of_local_day(day)).isoformat()
+        if interval_key in plant:
+            data[f"{DOMAIN}_{interval_key}_{device}"] = str(float(plant[interval_key]))
+    for key in PLANT_SETTINGS:
+        data[f"{DOMAIN}_{key}_{device}"] = str(plant.get(key, "notset"))
+    return data
+
+
+async def async_validate_row(
+    hass: HomeAssistant, row: Any, devices: set[str]
+) -> dict[str, Any]:
+    """
+    Return the config entry data of a row, storing its photo.
+
+    Raises vol.Invalid if the row isn't a valid new plant.
+    """
+    if not isinstance(row, dict):
+        msg = "Expected an object with the fields of a plant"
+        raise vol.Invalid(msg)
+    # Empty CSV cells are missing fields
+    plant = IMPORT_ROW_SCHEMA(
+        {key: value for key, value in row.items() if value not in ("", None)}
+    )
+    if slugify(plant["name"]) in devices:
+        msg = f"A plant named {plant['name']} already exists"
+        raise vol.Invalid(msg)
+    today = async_get_clock(hass).today()
+    for last_key, _ in CARE_SCHEDULE_KEYS.values():
+        if date.fromisoformat(plant[last_key]) > today:
+            msg = f"{last_key} is in the future"
+            raise vol.Invalid(msg)
+    plant["name_by_user"] = plant["name"]
+    if photo := plant["photo"]:
+        if not await hass.async_add_executor_job(hass.config.is_allowed_path, photo):
+            msg = f"Photo {photo} is not in an allowed directory"
+            raise vol.Invalid(msg)
+        try:
+            plant.update(
+                await async_store_photo(
+                    hass, Path(photo), ulid_now(), PhotoSettings.from_data(plant)
+                )
+            )
+        except ValueError as err:
+            msg = f"Photo {photo} is not an image"
+            raise vol.Invalid(msg) from err
+        except OSError as err:
+            msg = f"Photo {photo} can't be read: {err}"
+            raise vol.Invalid(msg) from err
+    return plant
+
+
+async def async_import_plants(
+    hass: HomeAssistant, path: Path, batch_size: int = IMPORT_BATCH_SIZE
+) -> dict[str, Any]:
+    """
+    Create plants from the rows of a local CSV or JSON file.
+
+    The file is read `batch_size` rows at a time in the executor, and each row
+    validated as it is read: invalid rows are reported and skipped. The stored
+    data of all new plants is saved in a single write, then their config
+    entries are created `batch_size` at a time.
+
+    Raises ValueError or OSError if the file can't be read.
+    """
+    reader = ROW_READERS.get(path.suffix.lower())
+    if reader is None:
+        msg = f"Unsupported file type {path.suffix}, expected .csv or .json"
+        raise ValueError(msg)
+    file = await hass.async_add_executor_job(
+        lambda: path.open(encoding="utf-8-sig", newline="")
+    )
+    devices = {
+        slugify(entry.title) for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    plants: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    row_number = 0
+    try:
+        rows = reader(file)
+        while batch := await hass.async_add_executor_job(read_batch, rows, batch_size):
+            for row in batch:
+                row_number += 1
+                try:
+                    plant = await async_validate_row(hass, row, devices)
+                except vol.Invalid as err:
+                    name = row.get("name") if isinstance(row, dict) else None
+                    errors.append({"row": row_number, "name": name, "error": str(err)})
+                    continue
+                devices.add(slugify(plant["name"]))
+                plants.append(plant)
+    except csv.Error as err:
+        raise ValueError(str(err)) from err
+    finally:
+        await hass.async_add_executor_job(file.close)
+
+    if plants:
+        await SimplePlantExtendedStore(hass).async_save_devices(
+            {
+                slugify(plant["name"]): initial_data(slugify(plant["name"]), plant)
+                for plant in plants
+                if not plant["compact"]
+            }
+        )
+    for start in range(0, len(plants), batch_size):
+        await asyncio.gather(
+            *(
+                hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=plant
+                )
+                for plant in plants[start : start + batch_size]
+            )
+        )
+        LOGGER.info(
+            "Imported %d of %d plants from %s",
+            min(start + batch_size, len(plants)),
+            len(plants),
+            path,
+        )
+    return {
+        "rows": row_number,
+        "created": [plant["name"] for plant in plants],
+        "errors": errors,
+    }
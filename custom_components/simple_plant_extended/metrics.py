@@ -0,0 +1,126 @@
+"""Hot path metrics of simple_plant_extended."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import (
+    DATA_METRICS,
+    METRIC_GET_DATES,
+    METRIC_LOAD,
+    METRIC_REFRESH,
+    METRIC_SAVE_DATA,
+    METRIC_STATE_WRITE,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+HOT_PATHS = (
+    METRIC_GET_DATES,
+    METRIC_SAVE_DATA,
+    METRIC_LOAD,
+    METRIC_REFRESH,
+    METRIC_STATE_WRITE,
+)
+
+# Buckets of the latency histogram, enough for any duration in ns
+HISTOGRAM_SIZE = 256
+
+
+def _bucket(duration_ns: int) -> int:
+    """Return the histogram bucket of a duration, four buckets per doubling."""
+    if duration_ns < 8:  # noqa: PLR2004
+        return max(duration_ns, 0)
+    shift = duration_ns.bit_length() - 3
+    return (shift << 2) + (duration_ns >> shift)
+
+
+def _bucket_ceiling(bucket: int) -> int:
+    """Return the longest duration counted in a histogram bucket."""
+    if bucket < 8:  # noqa: PLR2004
+        return bucket
+    shift = (bucket >> 2) - 1
+    return (((bucket & 3) + 5) << shift) - 1
+
+
+@dataclass(slots=True)
+class HotPathMetric:
+    """
+    Calls, total time and latency histogram of a hot path.
+
+    Recording only counts and increments a histogram bucket, percentiles
+    are computed when read, at most a quarter above the actual latency.
+    """
+
+    calls: int = 0
+    total_ns: int = 0
+    bytes: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * HISTOGRAM_SIZE)
+
+    def record(self, duration_ns: int) -> None:
+        """Count a call that took `duration_ns`."""
+        self.calls += 1
+        self.total_ns += duration_ns
+        self.histogram[_bucket(duration_ns)] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency in ms under which `fraction` of the calls ran."""
+        if not self.calls:
+            return None
+        rank = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                return _bucket_ceiling(bucket) / 1e6
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metric, with times in ms."""
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "bytes": self.bytes,
+        }
+
+
+class SimplePlantExtendedMetrics:
+    """Metrics of the hot paths of all plants, since Home Assistant started."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.paths = {path: HotPathMetric() for path in HOT_PATHS}
+        # Number of saves skipped because nothing changed
+        self.avoided_writes = 0
+        # Serializing the saved data is only worth it while a sensor shows it
+        self.count_bytes = False
+
+    @callback
+    def async_record(self, path: str, duration_ns: int) -> None:
+        """Count a call of a hot path that took `duration_ns`."""
+        self.paths[path].record(duration_ns)
+
+    @callback
+    def async_snapshot(self) -> dict[str, Any]:
+        """Return all metrics."""
+        return {
+            **{path: metric.as_dict() for path, metric in self.paths.items()},
+            "avoided_writes": self.avoided_writes,
+        }
+
+
+@callback
+def async_get_metrics(hass: HomeAssistant) -> SimplePlantExtendedMetrics:
+    """Get the hot path metrics, creating them on first use."""
+    if (metrics := hass.data.get(DATA_METRICS)) is not None:
+        return metrics
+
+    metrics = SimplePlantExtendedMetrics()
+    hass.data[DATA_METRICS] = metrics
+    return metrics
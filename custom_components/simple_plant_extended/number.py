@@ -11,8 +11,10 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import UnitOfTime
+from homeassistant.core import callback
 
 from .const import DOMAIN, LOGGER
+from .entity import SimplePlantExtendedEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -68,13 +70,17 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the number platform."""
-    async_add_entities(
-        SimplePlantExtendedNumber(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
+    coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_add_platform_entities(
+        async_add_entities,
+        lambda: (
+            SimplePlantExtendedNumber(hass, entry, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
+        ),
     )
 
 
-class SimplePlantExtendedNumber(NumberEntity):
+class SimplePlantExtendedNumber(SimplePlantExtendedEntity, NumberEntity):
     """simple_plant_extended number class."""
 
     _attr_has_entity_name = True
@@ -115,6 +121,9 @@ class SimplePlantExtendedNumber(NumberEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._async_handle_stored_value)
+        )
 
         def warning(msg: str) -> None:
             LOGGER.warning("%s :%s", self.unique_id, msg)
@@ -127,10 +136,21 @@ class SimplePlantExtendedNumber(NumberEntity):
             if self._fallback_value is None:
                 warning("Initialization failed as _fallback_value is None")
                 return
-            await self.async_set_native_value(self._fallback_value)
+            await self.async_set_native_value(float(self._fallback_value))
             return
         await self.async_set_native_value(float(data))
 
+    @callback
+    def _async_handle_stored_value(self) -> None:
+        """Follow the stored value, when stored without the entity."""
+        try:
+            value = float((self.coordinator.data or {})[self.unique_id])
+        except (KeyError, ValueError):
+            return
+        if value != self._attr_native_value:
+            self._attr_native_value = value
+            self.async_write_ha_state()
+
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self._attr_native_value = value
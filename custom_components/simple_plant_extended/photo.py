@@ -0,0 +1,237 @@
+"""Photo transcoding for simple_plant_extended."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiofiles
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+
+from .const import (
+    DATA_PHOTO_POOL,
+    DEFAULT_PHOTO_MAX_SIZE,
+    DEFAULT_PHOTO_QUALITY,
+    IMAGES_MIME_TYPES,
+    LOGGER,
+    PHOTO_FORMATS,
+    PHOTO_PASSTHROUGH_SUFFIXES,
+    STORAGE_DIR,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from concurrent.futures import ProcessPoolExecutor
+
+    from homeassistant.core import Event, HomeAssistant
+
+PHOTO_SUFFIXES = {
+    "webp": ".webp",
+    "jpeg": ".jpg",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PhotoSettings:
+    """Transcoding settings of a plant photo."""
+
+    photo_format: str = "original"
+    quality: int = DEFAULT_PHOTO_QUALITY
+    max_size: int = DEFAULT_PHOTO_MAX_SIZE
+    keep_original: bool = False
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> PhotoSettings:
+        """Build settings from config entry data or flow user input."""
+        photo_format = str(data.get("photo_format", "original"))
+        if photo_format not in PHOTO_FORMATS:
+            photo_format = "original"
+        return cls(
+            photo_format=photo_format,
+            quality=int(data.get("photo_quality", DEFAULT_PHOTO_QUALITY)),
+            max_size=int(data.get("photo_max_size", DEFAULT_PHOTO_MAX_SIZE)),
+            keep_original=bool(data.get("photo_keep_original", False)),
+        )
+
+    def should_transcode(self, suffix: str) -> bool:
+        """Return true if a file with `suffix` has to be re-encoded."""
+        return (
+            self.photo_format != "original"
+            and suffix.lower() not in PHOTO_PASSTHROUGH_SUFFIXES
+        )
+
+
+def transcode_photo(
+    source: str,
+    destination: str,
+    photo_format: str,
+    quality: int,
+    max_size: int,
+) -> bool:
+    """
+    Re-encode `source` into `destination`.
+
+    Runs in a worker process. Returns false when the re-encoded file would not
+    be smaller than the source, in which case nothing is written.
+    """
+    from PIL import Image, ImageOps  # noqa: PLC0415 - only needed in the worker
+
+    source_path = Path(source)
+    destination_path = Path(destination)
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        resized = max(image.size) > max_size
+        if resized:
+            image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        if photo_format == "jpeg":
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            image.save(
+                destination_path,
+                "JPEG",
+                quality=quality,
+                optimize=True,
+                progressive=True,
+            )
+        else:
+            image.save(destination_path, "WEBP", quality=quality, method=4)
+
+    if not resized and destination_path.stat().st_size >= source_path.stat().st_size:
+        destination_path.unlink()
+        return False
+    return True
+
+
+@callback
+def _async_get_pool(hass: HomeAssistant) -> ProcessPoolExecutor:
+    """Get the process pool used for transcoding, creating it on first use."""
+    if (pool := hass.data.get(DATA_PHOTO_POOL)) is not None:
+        return pool
+
+    # Only needed once a photo is transcoded, kept out of the startup imports
+    import multiprocessing  # noqa: PLC0415
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    pool = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    hass.data[DATA_PHOTO_POOL] = pool
+
+    @callback
+    def _shutdown(_event: Event) -> None:
+        hass.data.pop(DATA_PHOTO_POOL, None)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _shutdown)
+    return pool
+
+
+async def async_transcode_photo(
+    hass: HomeAssistant,
+    source: Path,
+    destination_stem: Path,
+    settings: PhotoSettings,
+) -> Path | None:
+    """
+    Transcode `source` next to `destination_stem` in the background.
+
+    Returns the path of the re-encoded file, or None if the source has to be
+    kept as-is.
+    """
+    from concurrent.futures.process import BrokenProcessPool  # noqa: PLC0415
+
+    destination = destination_stem.with_suffix(PHOTO_SUFFIXES[settings.photo_format])
+    pool = _async_get_pool(hass)
+    try:
+        # Submitting may spawn the worker, keep that off the event loop
+        future = await hass.async_add_executor_job(
+            partial(
+                pool.submit,
+                transcode_photo,
+                str(source),
+                str(destination),
+                settings.photo_format,
+                settings.quality,
+                settings.max_size,
+            )
+        )
+        written = await asyncio.wrap_future(future)
+    except BrokenProcessPool as err:
+        # Let the next upload start from a fresh pool
+        if hass.data.get(DATA_PHOTO_POOL) is pool:
+            hass.data.pop(DATA_PHOTO_POOL)
+        LOGGER.warning("Transcoding worker died, keeping original: %s", err)
+        return None
+    except (OSError, ValueError) as err:
+        LOGGER.warning("Failed to transcode %s, keeping original: %s", source, err)
+        return None
+    return destination if written else None
+
+
+async def async_store_photo(
+    hass: HomeAssistant,
+    source: Path,
+    name: str,
+    settings: PhotoSettings,
+) -> dict[str, str]:
+    """
+    Permanently store the image `source` as `name` in the storage directory.
+
+    Returns the url paths of the stored photo: `photo`, and `photo_original`
+    when a transcoded photo is stored alongside its original.
+    Raises ValueError if `source` is not a supported image type.
+    """
+    suffix = source.suffix
+    if suffix not in IMAGES_MIME_TYPES:
+        raise ValueError
+
+    storage_dir = Path(hass.config.path(STORAGE_DIR))
+    await hass.async_add_executor_job(
+        partial(storage_dir.mkdir, parents=True, exist_ok=True)
+    )
+    file_path = storage_dir / f"{name}{suffix}"
+
+    photo: dict[str, str] = {}
+    if settings.should_transcode(suffix):
+        transcoded = await async_transcode_photo(
+            hass, source, storage_dir / name, settings
+        )
+        if transcoded is not None:
+            photo["photo"] = f"/{STORAGE_DIR}/{transcoded.name}"
+            if not settings.keep_original:
+                return photo
+            file_path = storage_dir / f"{name}_original{suffix}"
+
+    # Safely copy the file using async operations
+    async with aiofiles.open(source, "rb") as source_file:  # noqa: SIM117
+        async with aiofiles.open(file_path, "wb") as destination_file:
+            await destination_file.write(await source_file.read())
+
+    # relative path
+    key = "photo_original" if photo else "photo"
+    photo[key] = f"/{STORAGE_DIR}/{file_path.name}"
+    return photo
+
+
+def remove_photo_file(hass: HomeAssistant, photo_path: str | None) -> None:
+    """Remove a photo file from its url path."""
+    try:
+        if photo_path:
+            # Convert url path to actual file path
+            file_path = Path(str(hass.config.path(photo_path.lstrip("/"))))
+
+            LOGGER.info("Trying to remove: %s", photo_path)
+
+            # Check if file exists before trying to remove it
+            if file_path.exists():
+                file_path.unlink()
+                LOGGER.info("Successfully removed image file: %s", file_path)
+            else:
+                LOGGER.warning("Image file not found: %s", file_path)
+    except OSError as err:
+        LOGGER.error("Error reading image file %s: %s", file_path, err)
@@ -8,10 +8,18 @@ from homeassistant.components.select import (
     SelectEntity,
     SelectEntityDescription,
 )
-
-from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import DOMAIN, HEALTH_OPTIONS, LOGGER, FEED_OPTIONS,ENABLED_OPTIONS, ILLUMINATION_OPTIONS
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    ENABLED_OPTIONS,
+    FEED_OPTIONS,
+    HEALTH_OPTIONS,
+    ILLUMINATION_OPTIONS,
+    LOGGER,
+    OPTIONAL_CARE_TYPES,
+)
+from .entity import SimplePlantExtendedEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -81,10 +89,12 @@ async def async_setup_entry(
     )
 
 
-class SimplePlantExtendedSelect(SelectEntity):
+class SimplePlantExtendedSelect(SimplePlantExtendedEntity, SelectEntity):
     """simple_plant_extended select class."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"state_color", "color"})
 
     def __init__(
         self,
@@ -96,6 +106,7 @@ class SimplePlantExtendedSelect(SelectEntity):
         super().__init__()
         self.entity_description = description
         self._fallback_value = str(entry.data.get(description.key, "notset"))
+        self._attr_current_option = None
         self.coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
 
         device = self.coordinator.device
@@ -103,6 +114,16 @@ class SimplePlantExtendedSelect(SelectEntity):
         self.entity_id = f"select.{DOMAIN}_{description.key}_{device}"
         self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
 
+        # Care type enabled by this select, if any
+        self._care_type = next(
+            (
+                care
+                for care, key in OPTIONAL_CARE_TYPES.items()
+                if key == description.key
+            ),
+            None,
+        )
+
         self._attr_extra_state_attributes = {
             "state_color": False,
         }
@@ -117,54 +138,10 @@ class SimplePlantExtendedSelect(SelectEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
-        
-        async def _select_updated(event, new_value=None):
-
-            if self.entity_description.key in ["cleaning_enabled", "misting_enabled"]:
-                subject = None
-                if self.entity_description.key == "misting_enabled":
-                    subject = "misting"
-                    subject_short = "mist"
-                elif self.entity_description.key == "cleaning_enabled":
-                    subject = "cleaning"
-                    subject_short = "clean"
-                
-                if new_value != None:
-                    new_state = new_value
-                else:
-                    new_state_obj = event.data.get("new_state")
-                    new_state = new_state_obj.state if new_state_obj else None
-
-                if new_state == "on":
-                    await self.hass.services.async_call(
-                        "homeassistant", "turn_on",
-                        {"entity_id": [
-                            f"button.{DOMAIN}_mark_{subject_short}ed_{self.device}",
-                            f"date.{DOMAIN}_last_{subject_short}ed_{self.device}",
-                            f"number.{DOMAIN}_days_between_{subject}s_{self.device}",
-                            f"binary_sensor.{DOMAIN}_{subject}_problem_{self.device}",
-                            f"binary_sensor.{DOMAIN}_{subject}_todo_{self.device}",
-                            f"sensor.{DOMAIN}_next_{subject}_{self.device}",
-                            ]
-                        },
-                        blocking=True,
-                    )
-                elif new_state == "off":
-                    await self.hass.services.async_call(
-                        "homeassistant", "turn_off",
-                        {"entity_id": [
-                            f"button.{DOMAIN}_mark_{subject_short}ed_{self.device}",
-                            f"date.{DOMAIN}_last_{subject_short}ed_{self.device}",
-                            f"number.{DOMAIN}_days_between_{subject}s_{self.device}",
-                            f"binary_sensor.{DOMAIN}_{subject}_problem_{self.device}",
-                            f"binary_sensor.{DOMAIN}_{subject}_todo_{self.device}",
-                            f"sensor.{DOMAIN}_next_{subject}_{self.device}",
-                            ]
-                        },
-                        blocking=True,
-                    )
-                
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._async_handle_stored_option)
+        )
 
         def warning(msg: str) -> None:
             LOGGER.warning("%s :%s", self.unique_id, msg)
@@ -182,20 +159,18 @@ class SimplePlantExtendedSelect(SelectEntity):
             return
         await self.async_select_option(data)
 
-        # await _select_updated({"data": {"new_state": data}}, new_value=data)
-
-
-        # Volg de select-waarde
-        # self.async_on_remove(
-        #     async_track_state_change_event(
-        #         self.hass,
-        #         f"select.{DOMAIN}_{self.entity_description.key}_{self.device}",
-        #         _select_updated
-        #     )
-        # )
+    @callback
+    def _async_handle_stored_option(self) -> None:
+        """Follow the stored option, when stored without the entity."""
+        option = (self.coordinator.data or {}).get(self.unique_id)
+        if option is None or option == self._attr_current_option:
+            return
+        self._async_set_option(option)
+        self.async_write_ha_state()
 
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
+    @callback
+    def _async_set_option(self, option: str) -> None:
+        """Show an option, turning the entities of its care type on or off."""
         self._attr_current_option = option
         # Color
         if option in COLOR_MAPPING:
@@ -205,6 +180,18 @@ class SimplePlantExtendedSelect(SelectEntity):
             }
         else:
             self._attr_extra_state_attributes = {"state_color": False}
+        # Turn the entities of the care type on or off
+        if self._care_type is not None:
+            self.coordinator.async_set_care_type_enabled(
+                self._care_type, option != "off"
+            )
+
+    async def async_select_option(self, option: str) -> None:
+        """Change the selected option."""
+        changed = option != self._attr_current_option
+        self._async_set_option(option)
+        if changed:
+            self.async_write_ha_state()
         # Save to persistent storage
         if self.unique_id is not None:
             await self.coordinator.async_store_value(self.unique_id, option)
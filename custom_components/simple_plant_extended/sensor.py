@@ -2,31 +2,47 @@
 
 from __future__ import annotations
 
-from datetime import datetime   
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from datetime import date
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
 
-from custom_components.hacs.validate import description
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_change,
+from homeassistant.const import EntityCategory, UnitOfInformation
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, PLANT_SETTINGS, PLANT_STATES
+from .coordinator import (
+    CARE_SCHEDULE_KEYS,
+    SIGNAL_SCHEDULE_UPDATED,
+    SimplePlantExtendedCoordinator,
+)
+from .entity import SimplePlantExtendedEntity
+from .fleet import HISTOGRAM_BUCKETS, SimplePlantExtendedFleet, async_get_fleet
+from .metrics import (
+    HOT_PATHS,
+    METRIC_SAVE_DATA,
+    SimplePlantExtendedMetrics,
+    async_get_metrics,
 )
-from homeassistant.util.dt import as_local
-
-from .const import DOMAIN
 
 if TYPE_CHECKING:
-    from datetime import date, datetime
+    from collections.abc import Callable
 
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 
-    from .coordinator import SimplePlantExtendedCoordinator
+    from .coordinator import PlantSchedule
 
 
 ENTITY_DESCRIPTIONS = (
@@ -64,8 +80,135 @@ ENTITY_DESCRIPTIONS = (
     # ),
 )
 
+# Single entity of plants in compact mode
+PLANT_DESCRIPTION = SensorEntityDescription(
+    device_class=SensorDeviceClass.ENUM,
+    key="plant",
+    translation_key="plant",
+    icon="mdi:flower",
+    options=PLANT_STATES,
+)
+
 COLOR_MAPPING = {"Today": "Goldenrod", "Late": "Tomato"}
 
+HISTOGRAM_LABELS = [
+    str(low) if high - low == 1 else f"{low}-{high - 1}"
+    for low, high in pairwise(HISTOGRAM_BUCKETS)
+] + [f"{HISTOGRAM_BUCKETS[-1]}+"]
+
+
+def _most_overdue(fleet: SimplePlantExtendedFleet) -> tuple[StateType, dict[str, Any]]:
+    """Return the most overdue plant, with its care and days overdue."""
+    if (most_overdue := fleet.most_overdue()) is None:
+        return None, {}
+    next_date, entry_id, care = most_overdue
+    # Plants are counted from their first refresh, before their coordinator is
+    # stored, their config entry is there all along
+    entry = fleet.hass.config_entries.async_get_entry(entry_id)
+    return entry.title if entry is not None else None, {
+        "care": care,
+        "days_overdue": (fleet.today - next_date).days,
+    }
+
+
+@dataclass(frozen=True, kw_only=True)
+class FleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor counting the care of all plants."""
+
+    value_fn: Callable[[SimplePlantExtendedFleet], tuple[StateType, dict[str, Any]]]
+
+
+FLEET_DESCRIPTIONS = (
+    FleetSensorEntityDescription(
+        key="due_today",
+        translation_key="due_today",
+        icon="mdi:calendar-today",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: (
+            fleet.due_today.total(),
+            {care: fleet.due_today[care] for care in CARE_SCHEDULE_KEYS},
+        ),
+    ),
+    *(
+        FleetSensorEntityDescription(
+            key=f"overdue_{care}",
+            translation_key=f"overdue_{care}",
+            icon="mdi:alert-circle-outline",
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda fleet, care=care: (fleet.overdue[care], {}),
+        )
+        for care in CARE_SCHEDULE_KEYS
+    ),
+    FleetSensorEntityDescription(
+        key="most_overdue",
+        translation_key="most_overdue",
+        icon="mdi:flower-poppy",
+        value_fn=_most_overdue,
+    ),
+    FleetSensorEntityDescription(
+        key="overdue_days",
+        translation_key="overdue_days",
+        icon="mdi:chart-histogram",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: (
+            sum(fleet.histogram),
+            dict(zip(HISTOGRAM_LABELS, fleet.histogram, strict=True)),
+        ),
+    ),
+)
+
+
+def _hot_path(
+    path: str,
+) -> Callable[[SimplePlantExtendedMetrics], tuple[StateType, dict[str, Any]]]:
+    """Return the calls of a hot path, with its timings."""
+
+    def value_fn(
+        metrics: SimplePlantExtendedMetrics,
+    ) -> tuple[StateType, dict[str, Any]]:
+        metric = metrics.paths[path].as_dict()
+        return metric.pop("calls"), {
+            key: metric[key] for key in ("total_ms", "p50_ms", "p99_ms")
+        }
+
+    return value_fn
+
+
+@dataclass(frozen=True, kw_only=True)
+class MetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor of the hot path metrics."""
+
+    value_fn: Callable[[SimplePlantExtendedMetrics], tuple[StateType, dict[str, Any]]]
+    counts_bytes: bool = False
+
+
+METRIC_DESCRIPTIONS = (
+    *(
+        MetricSensorEntityDescription(
+            key=f"metric_{path}",
+            translation_key=f"metric_{path}",
+            icon="mdi:timer-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            value_fn=_hot_path(path),
+        )
+        for path in HOT_PATHS
+    ),
+    MetricSensorEntityDescription(
+        key="bytes_persisted",
+        translation_key="bytes_persisted",
+        icon="mdi:content-save-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: (metrics.paths[METRIC_SAVE_DATA].bytes, {}),
+        counts_bytes=True,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -73,16 +216,52 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if coordinator.compact:
+        async_add_entities(
+            [SimplePlantExtendedPlantSensor(hass, entry, PLANT_DESCRIPTION)]
+        )
+        return
+    coordinator.async_add_platform_entities(
+        async_add_entities,
+        lambda: (
+            SimplePlantExtendedSensor(hass, entry, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
+        ),
+    )
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    _config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the sensors counting the care of all plants, and the metrics."""
+    if discovery_info is None:
+        return
+    fleet = async_get_fleet(hass)
+    metrics = async_get_metrics(hass)
     async_add_entities(
-        SimplePlantExtendedSensor(hass, entry, entity_description)
-        for entity_description in ENTITY_DESCRIPTIONS
+        [
+            *(
+                SimplePlantExtendedFleetSensor(fleet, description)
+                for description in FLEET_DESCRIPTIONS
+            ),
+            *(
+                SimplePlantExtendedMetricSensor(metrics, description)
+                for description in METRIC_DESCRIPTIONS
+            ),
+        ]
     )
 
 
-class SimplePlantExtendedSensor(SensorEntity):
+class SimplePlantExtendedSensor(SimplePlantExtendedEntity, RestoreSensor):
     """simple_plant_extended sensor class."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"state_color", "color"})
 
     def __init__(
         self,
@@ -93,6 +272,7 @@ class SimplePlantExtendedSensor(SensorEntity):
         """Initialize the sensor class."""
         super().__init__()
         self.entity_description = description
+        self._care = description.key.removeprefix("next_")
         self._fallback_value: date | None = None
         self._attr_native_value: date | None = None
         self.coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
@@ -126,93 +306,238 @@ class SimplePlantExtendedSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        last_date = None
-        daysbetween = None
-        if "watering" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_watered_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_waterings_{self.device}"
-        if "fertilization" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_fertilized_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_fertilizations_{self.device}"
-        if "misting" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_misted_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_mistings_{self.device}"
-        if "cleaning" in self.entity_description.key:
-            last_date = f"date.{DOMAIN}_last_cleaned_{self.device}"
-            daysbetween = f"number.{DOMAIN}_days_between_cleanings_{self.device}"
-
-
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                last_date,
-                self._update_state,
-            )
-        )
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                daysbetween,
-                self._update_state,
-            )
-        )
+        # Last known date until the schedule tells otherwise
+        if (last_data := await self.async_get_last_sensor_data()) is not None and (
+            isinstance(last_data.native_value, date)
+        ):
+            self._fallback_value = last_data.native_value
         self.async_on_remove(
-            async_track_time_change(
+            async_dispatcher_connect(
                 self.hass,
-                self._update_state,
-                hour=0,
-                minute=0,
-                second=0,
+                SIGNAL_SCHEDULE_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._async_handle_schedule,
             )
         )
 
         # Initial update
-        await self._update_state()
-
-    async def _update_state(
-        self, _event: Event[EventStateChangedData] | datetime | None = None
-    ) -> None:
-        """Update the binary sensor state based on other entities."""
-        dates = await self.coordinator.get_dates()
-
-        if not dates:
+        if (schedule := self.coordinator.schedule) is not None:
+            self._async_handle_schedule(schedule)
+
+    @callback
+    def _async_handle_schedule(self, schedule: PlantSchedule) -> None:
+        """Update the sensor state from the plant schedule."""
+        next_action_date = schedule.next.get(self._care)
+        if next_action_date is None:
             return
-        
-        next_date = None
-        key = None
-        if "water" in self.entity_description.key:
-            next_date = f"date.{DOMAIN}_next_watering_{self.device}"
-            key = "next_watering"
-        if "fertilization" in self.entity_description.key:
-            next_date = f"date.{DOMAIN}_next_fertilization_{self.device}"
-            key = "next_fertilization"
-        if "misting" in self.entity_description.key:
-            next_date = f"date.{DOMAIN}_next_misting_{self.device}"
-            key = "next_misting"
-        if "cleaning" in self.entity_description.key:
-            next_date = f"date.{DOMAIN}_next_cleaning_{self.device}"
-            key = "next_cleaning"
 
         # Color
-        today = as_local(dates["today"]).date()
-        next_action_date = as_local(datetime.fromisoformat("1970-01-01")).date()
-        if as_local(dates[key]).date() not in ["unknown", "", None]:
-            next_action_date = as_local(dates[key]).date()
-
         color_key = "OK"
-        if today == next_action_date:
+        if schedule.today == next_action_date:
             color_key = "Today"
-        if today > next_action_date:
+        if schedule.today > next_action_date:
             color_key = "Late"
 
         if color_key in COLOR_MAPPING:
-            self._attr_extra_state_attributes = {
+            attributes = {
                 "state_color": True,
                 "color": COLOR_MAPPING[color_key],
             }
         else:
-            self._attr_extra_state_attributes = {"state_color": False}
+            attributes = {"state_color": False}
 
+        if (
+            next_action_date == self._attr_native_value
+            and attributes == self._attr_extra_state_attributes
+        ):
+            return
+        self._attr_extra_state_attributes = attributes
         # Value
         self._attr_native_value = next_action_date
         self.async_write_ha_state()
+
+
+class SimplePlantExtendedPlantSensor(
+    SimplePlantExtendedEntity,
+    CoordinatorEntity[SimplePlantExtendedCoordinator],
+    SensorEntity,
+):
+    """
+    simple_plant_extended plant sensor class, for compact mode.
+
+    The state tells if any care is due or late, the schedule and settings of
+    the plant are attributes.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        coordinator: SimplePlantExtendedCoordinator = hass.data[DOMAIN][entry.entry_id]
+        super().__init__(coordinator)
+        self.entity_description = description
+
+        device = self.coordinator.device
+
+        self.entity_id = f"sensor.{DOMAIN}_{description.key}_{device}"
+        self._attr_unique_id = f"{DOMAIN}_{description.key}_{device}"
+        self._attr_native_value: str | None = None
+        self._attr_extra_state_attributes = {}
+
+        # Set up device info
+        self._attr_device_info = self.coordinator.device_info
+
+    @property
+    def device(self) -> str | None:
+        """Return the device name."""
+        return self.coordinator.device
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_SCHEDULE_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._async_handle_schedule,
+            )
+        )
+
+        # Initial update
+        self._async_update_plant()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated settings."""
+        self._async_update_plant()
+
+    @callback
+    def _async_handle_schedule(self, _schedule: PlantSchedule) -> None:
+        """Handle a new schedule."""
+        self._async_update_plant()
+
+    @callback
+    def _async_update_plant(self) -> None:
+        """Update the state and attributes, writing them only if they changed."""
+        coordinator = self.coordinator
+        schedule = coordinator.schedule
+        if schedule is None:
+            return
+        data = coordinator.data or {}
+        entry_data = coordinator.config_entry.data
+
+        attributes: dict[str, Any] = {"species": entry_data.get("species")}
+        for key in PLANT_SETTINGS:
+            attributes[key] = data.get(
+                f"{DOMAIN}_{key}_{coordinator.device}", entry_data.get(key, "notset")
+            )
+        due: list[str] = []
+        late: list[str] = []
+        for care, next_date in schedule.next.items():
+            last_key, interval_key = CARE_SCHEDULE_KEYS[care]
+            attributes[last_key] = schedule.last[care].isoformat()
+            attributes[interval_key] = schedule.intervals[care]
+            attributes[f"next_{care}"] = next_date.isoformat()
+            if schedule.today >= next_date:
+                due.append(care)
+            if schedule.today > next_date:
+                late.append(care)
+        attributes["due"] = due
+        attributes["late"] = late
+
+        state = "late" if late else "due" if due else "ok"
+        if (
+            state == self._attr_native_value
+            and attributes == self._attr_extra_state_attributes
+        ):
+            return
+        self._attr_native_value = state
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
+
+
+class SimplePlantExtendedFleetSensor(SimplePlantExtendedEntity, SensorEntity):
+    """simple_plant_extended sensor counting the care of all plants."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    entity_description: FleetSensorEntityDescription
+
+    def __init__(
+        self,
+        fleet: SimplePlantExtendedFleet,
+        description: FleetSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__()
+        self.entity_description = description
+        self.fleet = fleet
+        self.entity_id = f"sensor.{DOMAIN}_{description.key}"
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+        self._attr_native_value, self._attr_extra_state_attributes = (
+            description.value_fn(fleet)
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.fleet.async_add_listener(self._async_handle_fleet))
+
+    @callback
+    def _async_handle_fleet(self) -> None:
+        """Write the new counts, if they changed."""
+        value, attributes = self.entity_description.value_fn(self.fleet)
+        if (
+            value == self._attr_native_value
+            and attributes == self._attr_extra_state_attributes
+        ):
+            return
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
+
+
+class SimplePlantExtendedMetricSensor(SimplePlantExtendedEntity, SensorEntity):
+    """
+    simple_plant_extended diagnostic sensor of the hot path metrics.
+
+    Polled, the metrics change with every state write.
+    """
+
+    _attr_has_entity_name = True
+    entity_description: MetricSensorEntityDescription
+
+    def __init__(
+        self,
+        metrics: SimplePlantExtendedMetrics,
+        description: MetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__()
+        self.entity_description = description
+        self.metrics = metrics
+        self.entity_id = f"sensor.{DOMAIN}_{description.key}"
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Count the bytes of the saved data while the sensor shows them."""
+        await super().async_added_to_hass()
+        if self.entity_description.counts_bytes:
+            self.metrics.count_bytes = True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop counting the bytes of the saved data."""
+        await super().async_will_remove_from_hass()
+        if self.entity_description.counts_bytes:
+            self.metrics.count_bytes = False
+
+    async def async_update(self) -> None:
+        """Read the metrics."""
+        self._attr_native_value, self._attr_extra_state_attributes = (
+            self.entity_description.value_fn(self.metrics)
+        )
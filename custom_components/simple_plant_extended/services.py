@@ -0,0 +1,326 @@
+"""Services for simple_plant_extended."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+    ENTITY_MATCH_NONE,
+)
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import async_get
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util.dt import as_utc, start_of_local_day
+from homeassistant.util.ulid import ulid_now
+
+from .clock import async_get_clock
+from .const import DOMAIN, IMPORT_BATCH_SIZE, PLANT_SETTINGS
+from .coordinator import (
+    CARE_SCHEDULE_KEYS,
+    MIGRATION_BATCH_SIZE,
+    async_mark_care_done,
+    async_migrate_legacy_data,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import SimplePlantExtendedCoordinator
+
+SERVICE_ADD_PHOTO = "add_photo"
+SERVICE_GET_METRICS = "get_metrics"
+SERVICE_IMPORT_PLANTS = "import_plants"
+SERVICE_LIST_PHOTOS = "list_photos"
+SERVICE_MARK_CARE = "mark_care"
+SERVICE_MIGRATE_LEGACY_DATA = "migrate_legacy_data"
+SERVICE_UPDATE_PLANT = "update_plant"
+
+# Fields of a service target
+TARGET_FIELDS = (
+    ATTR_DEVICE_ID,
+    ATTR_AREA_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+    ATTR_ENTITY_ID,
+)
+
+ADD_PHOTO_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required("file_path"): cv.string,
+        vol.Optional("date"): cv.datetime,
+    }
+)
+
+GET_METRICS_SCHEMA = vol.Schema({})
+
+IMPORT_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("file_path"): cv.string,
+        vol.Optional("batch_size", default=IMPORT_BATCH_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+LIST_PHOTOS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("limit", default=20): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+MARK_CARE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **cv.TARGET_SERVICE_FIELDS,
+            vol.Required("care"): vol.All(
+                cv.ensure_list, [vol.In(list(CARE_SCHEDULE_KEYS))]
+            ),
+            vol.Optional("date"): cv.date,
+        }
+    ),
+    cv.has_at_least_one_key(*TARGET_FIELDS),
+)
+
+MIGRATE_LEGACY_DATA_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional("batch_size", default=MIGRATION_BATCH_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+UPDATE_PLANT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        **{
+            vol.Optional(last_key): cv.date
+            for last_key, _ in CARE_SCHEDULE_KEYS.values()
+        },
+        **{
+            vol.Optional(interval_key): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=360)
+            )
+            for _, interval_key in CARE_SCHEDULE_KEYS.values()
+        },
+        **{
+            vol.Optional(key): vol.In(options)
+            for key, options in PLANT_SETTINGS.items()
+        },
+    }
+)
+
+
+@callback
+def async_get_coordinator(
+    hass: HomeAssistant, device_id: str
+) -> SimplePlantExtendedCoordinator:
+    """Get the coordinator of a plant device."""
+    device = async_get(hass).async_get(device_id)
+    if device is not None:
+        for entry_id in device.config_entries:
+            if (coordinator := hass.data[DOMAIN].get(entry_id)) is not None:
+                return coordinator
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="unknown_plant",
+        translation_placeholders={"device_id": device_id},
+    )
+
+
+@callback
+def async_get_target_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[SimplePlantExtendedCoordinator]:
+    """Get the coordinators of the plants targeted by a service call."""
+    coordinators: dict[str, SimplePlantExtendedCoordinator] = hass.data[DOMAIN]
+    # Plants given by device are checked, like the services of a single plant
+    for device_id in call.data.get(ATTR_DEVICE_ID, []):
+        if device_id != ENTITY_MATCH_NONE:
+            async_get_coordinator(hass, device_id)
+
+    selected = async_extract_referenced_entity_ids(hass, call)
+    device_registry = async_get(hass)
+    entity_registry = er.async_get(hass)
+    entry_ids = {
+        entry_id
+        for device_id in selected.referenced_devices
+        if (device := device_registry.async_get(device_id)) is not None
+        for entry_id in device.config_entries
+    }
+    entry_ids.update(
+        entity.config_entry_id
+        for entity_id in selected.referenced | selected.indirectly_referenced
+        if (entity := entity_registry.async_get(entity_id)) is not None
+    )
+    targets = [
+        coordinator
+        for entry_id, coordinator in coordinators.items()
+        if entry_id in entry_ids
+    ]
+    if not targets:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_targeted_plant",
+            translation_placeholders={},
+        )
+    return targets
+
+
+async def async_check_allowed_path(hass: HomeAssistant, file_path: str) -> None:
+    """Check that a local file may be read, stat-ing it in the executor."""
+    if not await hass.async_add_executor_job(hass.config.is_allowed_path, file_path):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"file_path": file_path},
+        )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:  # noqa: PLR0915
+    """Register the simple_plant_extended services."""
+
+    async def async_add_photo(call: ServiceCall) -> None:
+        """Add a local photo file to the timeline of a plant."""
+        from .photo import PhotoSettings, async_store_photo  # noqa: PLC0415
+
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        file_path = call.data["file_path"]
+        await async_check_allowed_path(hass, file_path)
+        settings = PhotoSettings.from_data(coordinator.config_entry.data)
+        try:
+            photo = await async_store_photo(hass, Path(file_path), ulid_now(), settings)
+        except ValueError as err:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_photo_type",
+                translation_placeholders={"file_path": file_path},
+            ) from err
+        except OSError as err:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="photo_not_found",
+                translation_placeholders={"file_path": file_path},
+            ) from err
+        coordinator.photos.async_add_photo(
+            photo, call.data.get("date") or coordinator.clock.utcnow()
+        )
+
+    async def async_get_metrics_snapshot(_call: ServiceCall) -> ServiceResponse:
+        """Return the hot path metrics of all plants."""
+        from .metrics import async_get_metrics  # noqa: PLC0415
+
+        return async_get_metrics(hass).async_snapshot()
+
+    async def async_import(call: ServiceCall) -> ServiceResponse:
+        """Create plants from a local CSV or JSON file."""
+        # The importer and its parsers are only loaded when importing
+        from .importer import async_import_plants  # noqa: PLC0415
+
+        file_path = call.data["file_path"]
+        await async_check_allowed_path(hass, file_path)
+        try:
+            return await async_import_plants(
+                hass, Path(file_path), call.data["batch_size"]
+            )
+        except (ValueError, OSError) as err:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_import_file",
+                translation_placeholders={"file_path": file_path, "error": str(err)},
+            ) from err
+
+    async def async_list_photos(call: ServiceCall) -> ServiceResponse:
+        """List a page of the photo timeline of a plant, newest first."""
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        return {
+            "total": len(coordinator.photos),
+            "offset": call.data["offset"],
+            "photos": coordinator.photos.async_list(
+                call.data["offset"], call.data["limit"]
+            ),
+        }
+
+    async def async_mark_care(call: ServiceCall) -> None:
+        """Mark care types of the targeted plants as done, today or on a date."""
+        coordinators = async_get_target_coordinators(hass, call)
+        clock = async_get_clock(hass)
+        day = call.data.get("date")
+        await async_mark_care_done(
+            coordinators,
+            call.data["care"],
+            (
+                clock.utcnow()
+                if day is None or day == clock.today()
+                else as_utc(start_of_local_day(day))
+            ),
+        )
+
+    async def async_migrate_legacy(call: ServiceCall) -> ServiceResponse:
+        """Migrate the data of the legacy entities of the targeted or all plants."""
+        if any(field in call.data for field in TARGET_FIELDS):
+            coordinators = async_get_target_coordinators(hass, call)
+        else:
+            coordinators = list(hass.data[DOMAIN].values())
+        return await async_migrate_legacy_data(coordinators, call.data["batch_size"])
+
+    async def async_update_plant(call: ServiceCall) -> None:
+        """Change dates, intervals and settings of a plant in a single write."""
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        await coordinator.async_update_plant(
+            {key: value for key, value in call.data.items() if key != ATTR_DEVICE_ID}
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_ADD_PHOTO, async_add_photo, schema=ADD_PHOTO_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_METRICS,
+        async_get_metrics_snapshot,
+        schema=GET_METRICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PLANTS,
+        async_import,
+        schema=IMPORT_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIST_PHOTOS,
+        async_list_photos,
+        schema=LIST_PHOTOS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_MARK_CARE, async_mark_care, schema=MARK_CARE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MIGRATE_LEGACY_DATA,
+        async_migrate_legacy,
+        schema=MIGRATE_LEGACY_DATA_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_UPDATE_PLANT, async_update_plant, schema=UPDATE_PLANT_SCHEMA
+    )
@@ -0,0 +1,167 @@
+"""Care history as long-term statistics for simple_plant_extended."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.dt import as_utc, utc_from_timestamp
+
+from .const import DATA_STATISTICS, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from homeassistant.components.recorder.models import StatisticData
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+STATISTICS_FLUSH_DELAY = 10
+
+
+def care_statistic_id(entry_id: str, care: str) -> str:
+    """Return the id of the statistic counting the care events of a plant."""
+    return f"{DOMAIN}:{care}_{entry_id.lower()}"
+
+
+class SimplePlantExtendedStatistics:
+    """
+    Care events of all plants, imported as hourly long-term statistics.
+
+    The sum of each statistic counts the care events of a plant, so the change
+    over a period is the number of waterings, mistings... in that period.
+    Events are buffered, then imported in one batch for all plants: a single
+    recorder job per statistic, holding all of its new hours.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the statistics."""
+        self.hass = hass
+        self._names: dict[str, str] = {}
+        self._pending: defaultdict[str, defaultdict[datetime, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        # Start and sum of the last imported hour of each statistic
+        self._last: dict[str, tuple[datetime | None, float]] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_record(
+        self, statistic_id: str, name: str, when: datetime, count: int = 1
+    ) -> None:
+        """Count `count` care events at `when`, imported with the next batch."""
+        start = as_utc(when).replace(minute=0, second=0, microsecond=0)
+        self._names[statistic_id] = name
+        self._pending[statistic_id][start] += count
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, STATISTICS_FLUSH_DELAY, self._async_scheduled_flush
+            )
+
+    async def _async_scheduled_flush(self, _now: datetime) -> None:
+        """Import the events buffered since the first one."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Import all buffered care events."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        pending, self._pending = self._pending, defaultdict(lambda: defaultdict(int))
+        if "recorder" not in self.hass.config.components:
+            return
+        # The recorder pulls in sqlalchemy, only import it once it is loaded
+        from homeassistant.components.recorder.models import (  # noqa: PLC0415
+            StatisticData,
+            StatisticMeanType,
+            StatisticMetaData,
+        )
+        from homeassistant.components.recorder.statistics import (  # noqa: PLC0415
+            async_add_external_statistics,
+        )
+
+        for statistic_id, counts in pending.items():
+            last_start, total = await self._async_get_last(statistic_id)
+            # Sums only grow forward in time, older events count in the last hour
+            hours: defaultdict[datetime, int] = defaultdict(int)
+            for start, count in counts.items():
+                hours[max(start, last_start) if last_start else start] += count
+            statistics: list[StatisticData] = []
+            for start in sorted(hours):
+                total += hours[start]
+                statistics.append(StatisticData(start=start, state=total, sum=total))
+            self._last[statistic_id] = (statistics[-1]["start"], total)
+
+            LOGGER.debug("Importing %d hours of %s", len(statistics), statistic_id)
+            async_add_external_statistics(
+                self.hass,
+                StatisticMetaData(
+                    has_sum=True,
+                    mean_type=StatisticMeanType.NONE,
+                    name=self._names[statistic_id],
+                    source=DOMAIN,
+                    statistic_id=statistic_id,
+                    unit_of_measurement=None,
+                ),
+                statistics,
+            )
+
+    async def _async_get_last(self, statistic_id: str) -> tuple[datetime | None, float]:
+        """Get the start and sum of the last imported hour of a statistic."""
+        if (last := self._last.get(statistic_id)) is not None:
+            return last
+        from homeassistant.components.recorder import get_instance  # noqa: PLC0415
+        from homeassistant.components.recorder.statistics import (  # noqa: PLC0415
+            get_last_statistics,
+        )
+
+        rows = await get_instance(self.hass).async_add_executor_job(
+            partial(
+                get_last_statistics,
+                self.hass,
+                1,
+                statistic_id,
+                convert_units=False,
+                types={"sum"},
+            )
+        )
+        last = (None, 0)
+        if row := rows.get(statistic_id):
+            last = (utc_from_timestamp(row[0]["start"]), row[0].get("sum") or 0)
+        self._last[statistic_id] = last
+        return last
+
+    @callback
+    def async_clear(self, statistic_ids: Iterable[str]) -> None:
+        """Forget statistics, removing their history."""
+        statistic_ids = list(statistic_ids)
+        for statistic_id in statistic_ids:
+            self._pending.pop(statistic_id, None)
+            self._last.pop(statistic_id, None)
+        if "recorder" in self.hass.config.components:
+            from homeassistant.components.recorder import (  # noqa: PLC0415
+                get_instance,
+            )
+
+            get_instance(self.hass).async_clear_statistics(statistic_ids)
+
+
+@callback
+def async_get_statistics(hass: HomeAssistant) -> SimplePlantExtendedStatistics:
+    """Get the care statistics, creating them on first use."""
+    if (statistics := hass.data.get(DATA_STATISTICS)) is not None:
+        return statistics
+
+    statistics = SimplePlantExtendedStatistics(hass)
+    hass.data[DATA_STATISTICS] = statistics
+
+    async def _flush(_event: Event) -> None:
+        await statistics.async_flush()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _flush)
+    return statistics
@@ -0,0 +1,116 @@
+"""Photo timeline for simple_plant_extended."""
+
+from __future__ import annotations
+
+from bisect import insort
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import as_local, as_utc
+
+from .const import LOGGER, PHOTO_TIMELINE_STORAGE_KEY
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+TIMELINE_STORAGE_VERSION = 1
+TIMELINE_SAVE_DELAY = 5
+
+
+class SimplePlantExtendedPhotoTimeline:
+    """
+    Dated photos of a plant.
+
+    The index is a list of `(timestamp, photo[, original])` records sorted by
+    timestamp, so that pages and the latest photo are plain list slices.
+    Photos themselves are never loaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the timeline."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            TIMELINE_STORAGE_VERSION,
+            f"{PHOTO_TIMELINE_STORAGE_KEY}.{entry_id}",
+        )
+        self._photos: list[tuple[str, ...]] = []
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    def __len__(self) -> int:
+        """Return the number of photos in the timeline."""
+        return len(self._photos)
+
+    @property
+    def latest(self) -> str | None:
+        """Return the url path of the most recent photo."""
+        if not self._photos:
+            return None
+        return self._photos[-1][1]
+
+    @property
+    def paths(self) -> list[str]:
+        """Return the url paths of all photo files, originals included."""
+        return [path for record in self._photos for path in record[1:]]
+
+    async def async_load(self) -> None:
+        """Load the index from storage."""
+        data = await self._store.async_load() or {}
+        self._photos = sorted(tuple(record) for record in data.get("photos", []))
+
+    @callback
+    def async_list(self, offset: int = 0, limit: int = 20) -> list[dict[str, str]]:
+        """Return a page of the timeline, newest first."""
+        end = max(len(self._photos) - offset, 0)
+        start = max(end - limit, 0)
+        return [
+            {"date": record[0], "photo": record[1]}
+            for record in reversed(self._photos[start:end])
+        ]
+
+    @callback
+    def async_add_photo(self, photo: dict[str, str], taken: datetime) -> None:
+        """Append a stored photo (as returned by `async_store_photo`)."""
+        timestamp = as_utc(as_local(taken)).replace(microsecond=0).isoformat()
+        record = (timestamp, photo["photo"])
+        if original := photo.get("photo_original"):
+            record = (*record, original)
+        insort(self._photos, record)
+        self._store.async_delay_save(self._data_to_save, TIMELINE_SAVE_DELAY)
+        LOGGER.debug("Added photo %s taken %s", photo["photo"], timestamp)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for new photos."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    async def async_remove(self) -> None:
+        """Remove all photos of the timeline and its index."""
+        from .photo import remove_photo_file  # noqa: PLC0415
+
+        await self.async_load()
+        paths = self.paths
+        self._photos = []
+
+        def remove_files() -> None:
+            for path in paths:
+                remove_photo_file(self.hass, path)
+
+        await self.hass.async_add_executor_job(remove_files)
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the index to store."""
+        return {"photos": [list(record) for record in self._photos]}
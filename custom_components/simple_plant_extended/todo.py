@@ -0,0 +1,157 @@
+"""Todo platform for simple_plant_extended."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.core import callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN
+from .coordinator import CARE_SCHEDULE_KEYS, SIGNAL_FLEET_UPDATED
+from .entity import SimplePlantExtendedEntity
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+    from .coordinator import PlantSchedule, SimplePlantExtendedCoordinator
+
+
+async def async_setup_platform(
+    _hass: HomeAssistant,
+    _config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the todo list of all plants."""
+    if discovery_info is None:
+        return
+    async_add_entities([SimplePlantExtendedTodoList()])
+
+
+class SimplePlantExtendedTodoList(SimplePlantExtendedEntity, TodoListEntity):
+    """
+    simple_plant_extended todo list of the care due for all plants.
+
+    Items are kept up to date from the schedule of each plant as it changes,
+    comparing it to the care that was already due for that plant only.
+    Completing an item marks the care as done.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_translation_key = "care"
+    _attr_icon = "mdi:flower-pollen"
+    _attr_unique_id = f"{DOMAIN}_care"
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+
+    def __init__(self) -> None:
+        """Initialize the todo list class."""
+        super().__init__()
+        self.entity_id = f"todo.{DOMAIN}_care"
+        self._items: dict[str, TodoItem] = {}
+        # Title and due care of each plant, by config entry id
+        self._plants: dict[str, tuple[str, dict[str, date]]] = {}
+        self._write_scheduled = False
+
+    @property
+    def todo_items(self) -> list[TodoItem]:
+        """Return the care due for all plants."""
+        return list(self._items.values())
+
+    @property
+    def state(self) -> int:
+        """Return the number of care due."""
+        return len(self._items)
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_FLEET_UPDATED, self._async_handle_fleet
+            )
+        )
+        coordinators: dict[str, SimplePlantExtendedCoordinator] = self.hass.data[DOMAIN]
+        for coordinator in coordinators.values():
+            self._update_plant(coordinator, coordinator.schedule)
+
+    @callback
+    def _async_handle_fleet(
+        self,
+        coordinator: SimplePlantExtendedCoordinator,
+        schedule: PlantSchedule | None,
+    ) -> None:
+        """Update the items of a plant, writing once per loop iteration."""
+        if self._update_plant(coordinator, schedule) and not self._write_scheduled:
+            self._write_scheduled = True
+            self.hass.loop.call_soon(self._async_write)
+
+    @callback
+    def _async_write(self) -> None:
+        """Write the state and push the items."""
+        self._write_scheduled = False
+        self.async_write_ha_state()
+
+    def _update_plant(
+        self,
+        coordinator: SimplePlantExtendedCoordinator,
+        schedule: PlantSchedule | None,
+    ) -> bool:
+        """Update the items of a plant, returning true if any changed."""
+        entry_id = coordinator.config_entry.entry_id
+        title = coordinator.config_entry.title
+        due: dict[str, date] = {}
+        if schedule is not None:
+            due = {
+                care: next_date
+                for care, next_date in schedule.next.items()
+                if schedule.today >= next_date
+            }
+        old_title, old_due = self._plants.pop(entry_id, (None, {}))
+        if due:
+            self._plants[entry_id] = (title, due)
+        if due == old_due and (title == old_title or not due):
+            return False
+
+        for care in old_due.keys() - due.keys():
+            del self._items[f"{entry_id}_{care}"]
+        for care, next_date in due.items():
+            if title != old_title or old_due.get(care) != next_date:
+                self._items[f"{entry_id}_{care}"] = TodoItem(
+                    summary=f"{care.capitalize()}: {title}",
+                    uid=f"{entry_id}_{care}",
+                    status=TodoItemStatus.NEEDS_ACTION,
+                    due=next_date,
+                )
+        return True
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Mark the care of a completed item as done."""
+        if item.status != TodoItemStatus.COMPLETED:
+            return
+        entry_id, _, care = (item.uid or "").rpartition("_")
+        coordinator: SimplePlantExtendedCoordinator | None = self.hass.data[DOMAIN].get(
+            entry_id
+        )
+        if item.uid not in self._items or coordinator is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="unknown_care_item",
+                translation_placeholders={"uid": str(item.uid)},
+            )
+        last_key, _ = CARE_SCHEDULE_KEYS[care]
+        await coordinator.async_action_mark_action(
+            action=last_key.removeprefix("last_")
+        )
@@ -0,0 +1 @@
+"""Tests for simple_plant_extended."""
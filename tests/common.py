@@ -0,0 +1,73 @@
+"""Helpers for simple_plant_extended tests."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.simple_plant_extended.const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def plant_data(index: int) -> dict[str, Any]:
+    """
+    Return the config entry data of a plant, as the config flow creates it.
+
+    Last dates are spread over the past days, so some care is due each day.
+    """
+    today = dt_util.now().date()
+
+    def last(days: int) -> str:
+        return (today - timedelta(days=index % days)).isoformat()
+
+    return {
+        "name": f"Plant {index}",
+        "name_by_user": f"Plant {index}",
+        "species": "Ficus",
+        "photo": "",
+        "last_watered": last(7),
+        "days_between_waterings": 7,
+        "fertilization_method": "liquid",
+        "last_fertilized": last(30),
+        "days_between_fertilizations": 30,
+        "misting_enabled": "on",
+        "last_misted": last(2),
+        "days_between_mistings": 2,
+        "cleaning_enabled": "on",
+        "last_cleaned": last(60),
+        "days_between_cleanings": 60,
+        "illumination": "sunny",
+        "health": "good",
+    }
+
+
+def add_plants(
+    hass: HomeAssistant, count: int, start: int = 0, **data: Any
+) -> list[MockConfigEntry]:
+    """Add the config entries of `count` plants, set up with the integration."""
+    entries = []
+    for index in range(start, start + count):
+        entry = MockConfigEntry(
+            domain=DOMAIN, title=f"Plant {index}", data=plant_data(index) | data
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
+
+
+async def async_add_plants(
+    hass: HomeAssistant, count: int, start: int = 0, **data: Any
+) -> None:
+    """Add `count` plants to a running fleet, as the config flow does."""
+    for index in range(start, start + count):
+        await hass.config_entries.async_add(
+            MockConfigEntry(
+                domain=DOMAIN, title=f"Plant {index}", data=plant_data(index) | data
+            )
+        )
+    await hass.async_block_till_done()
@@ -0,0 +1,50 @@
+"""Fixtures for simple_plant_extended tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.simple_plant_extended.data import SimplePlantExtendedStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options of the benchmark."""
+    group = parser.getgroup("simple_plant_extended")
+    group.addoption(
+        "--benchmark-output",
+        type=Path,
+        default=Path("benchmark.json"),
+        help="file the benchmark results are written to, as JSON",
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        type=Path,
+        help="results of a previous benchmark, to fail on regressions",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.25,
+        help="regression allowed against the baseline, 0.25 by default",
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,  # noqa: ARG001
+) -> None:
+    """Enable the integration in all tests."""
+    return
+
+
+@pytest.fixture(autouse=True)
+def reset_store() -> Iterator[None]:
+    """Drop the store, a singleton bound to the Home Assistant of a test."""
+    yield
+    SimplePlantExtendedStore._instance = None  # noqa: SLF001
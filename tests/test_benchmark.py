@@ -0,0 +1,144 @@
+"""Benchmarks of the integration on synthetic fleets of plants."""
+
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+from homeassistant.setup import async_setup_component
+
+from custom_components.simple_plant_extended.clock import async_get_clock
+from custom_components.simple_plant_extended.const import DOMAIN, METRIC_SAVE_DATA
+from custom_components.simple_plant_extended.metrics import async_get_metrics
+
+from .common import add_plants
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Iterator
+
+    from homeassistant.core import HomeAssistant
+
+PRESSES = 20
+
+# Lower is better for all of them
+METRICS = (
+    "setup_s",
+    "press_latency_median_ms",
+    "press_latency_max_ms",
+    "press_bytes_written",
+    "rollover_s",
+)
+
+
+@pytest.fixture
+def enable_event_loop_debug(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Run the loop as Home Assistant does, without the debug mode of tests."""
+    event_loop.set_debug(False)
+
+
+@pytest.fixture(scope="module")
+def benchmark_results(pytestconfig: pytest.Config) -> Iterator[dict[str, dict]]:
+    """Collect the results of each fleet size, written as JSON once all ran."""
+    results: dict[str, dict] = {}
+    yield results
+    output = pytestconfig.rootpath / pytestconfig.getoption("benchmark_output")
+    output.write_text(json.dumps(results, indent=2) + "\n")
+
+
+def regressions(pytestconfig: pytest.Config, size: int, results: dict) -> list[str]:
+    """Return the metrics worse than the baseline by more than the tolerance."""
+    if (path := pytestconfig.getoption("benchmark_baseline")) is None:
+        return []
+    baseline = json.loads(path.read_text()).get(str(size), {})
+    tolerance = pytestconfig.getoption("benchmark_tolerance")
+    return [
+        f"{metric} {baseline[metric]:.4g} -> {results[metric]:.4g}"
+        for metric in METRICS
+        if baseline.get(metric) and results[metric] > baseline[metric] * (1 + tolerance)
+    ]
+
+
+@pytest.mark.parametrize("size", [10, 100, 1000])
+async def test_fleet(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    pytestconfig: pytest.Config,
+    benchmark_results: dict[str, dict],
+    size: int,
+) -> None:
+    """
+    Measure a fleet of `size` plants.
+
+    Times the setup, the latency from a mark watered press to the new next
+    watering state, the bytes the store writes per press and the midnight
+    rollover.
+    """
+    caplog.set_level(logging.WARNING)
+    add_plants(hass, size)
+    results: dict = {"plants": size}
+
+    start = time.perf_counter()
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    results["setup_s"] = time.perf_counter() - start
+    results["entities"] = len(hass.states.async_all())
+
+    # Store writes, counted by the bytes persisted metric
+    metrics = async_get_metrics(hass)
+    metrics.count_bytes = True
+    save = metrics.paths[METRIC_SAVE_DATA]
+    calls, written = save.calls, save.bytes
+
+    # Press to state: from the button press to the new next watering date
+    changed: dict[str, float] = {}
+
+    @callback
+    def _on_state_changed(event: Event) -> None:
+        changed.setdefault(event.data["entity_id"], time.perf_counter())
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _on_state_changed)
+    # Pressing it on a plant watered today would undo the last watering
+    plants = [index for index in range(size) if index % 7][:PRESSES]
+    presses = len(plants)
+    latencies = []
+    for index in plants:
+        sensor = f"sensor.{DOMAIN}_next_watering_plant_{index}"
+        start = time.perf_counter()
+        await hass.services.async_call(
+            "button",
+            "press",
+            {"entity_id": f"button.{DOMAIN}_mark_watered_plant_{index}"},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+        assert sensor in changed
+        latencies.append((changed[sensor] - start) * 1000)
+    results["press_latency_median_ms"] = statistics.median(latencies)
+    results["press_latency_max_ms"] = max(latencies)
+    results["press_writes"] = (save.calls - calls) / presses
+    results["press_bytes_written"] = (save.bytes - written) / presses
+
+    # Midnight: every plant moves to the next day at once
+    clock = async_get_clock(hass)
+    tomorrow = clock.utcnow() + timedelta(days=1)
+    monkeypatch.setattr(clock, "utcnow", lambda: tomorrow)
+    changed.clear()
+    start = time.perf_counter()
+    for coordinator in hass.data[DOMAIN].values():
+        coordinator.async_handle_midnight(tomorrow)
+    await hass.async_block_till_done()
+    results["rollover_s"] = time.perf_counter() - start
+    results["rollover_state_writes"] = len(changed)
+    unsub()
+
+    benchmark_results[str(size)] = results
+    assert not regressions(pytestconfig, size, results)
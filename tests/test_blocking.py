@@ -0,0 +1,308 @@
+"""Code paths of the integration, checked for calls blocking the event loop."""
+
+from __future__ import annotations
+
+import builtins
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import threading
+import traceback
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.components.file_upload import _DATA, FileUploadData
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+from homeassistant.util.ulid import ulid_hex
+
+from custom_components.simple_plant_extended.const import DATA_DEBUG, DOMAIN
+from custom_components.simple_plant_extended.debug import INTEGRATION_DIR
+from custom_components.simple_plant_extended.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .common import add_plants, plant_data
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+# Loop steps held longer by the integration are reported, in seconds
+THRESHOLD = 0.05
+
+# File system calls that block the loop, by module
+BLOCKING_CALLS = {
+    builtins: ("open",),
+    io: ("open",),
+    os: (
+        "listdir",
+        "lstat",
+        "mkdir",
+        "remove",
+        "rename",
+        "replace",
+        "rmdir",
+        "scandir",
+        "stat",
+        "unlink",
+    ),
+    shutil: ("copy", "copy2", "copyfile", "move", "rmtree"),
+}
+
+
+@pytest.fixture
+def enable_event_loop_debug(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Run the loop without the debug mode of tests, which slows every step."""
+    event_loop.set_debug(False)
+
+
+@pytest.fixture
+def blocking_calls(monkeypatch: pytest.MonkeyPatch) -> dict[tuple[str, int], str]:
+    """Record the file system calls made on the loop by the integration."""
+    loop_thread = threading.get_ident()
+    reports: dict[tuple[str, int], str] = {}
+    recording = False
+
+    def record(module: Any, name: str, original: Callable) -> Callable:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal recording
+            if threading.get_ident() == loop_thread and not recording:
+                frame = sys._getframe(1)  # noqa: SLF001
+                while frame is not None and not frame.f_code.co_filename.startswith(
+                    INTEGRATION_DIR
+                ):
+                    frame = frame.f_back
+                # Reading the source lines of the stack calls os.stat too
+                recording = True
+                try:
+                    if frame is not None:
+                        key = (frame.f_code.co_filename, frame.f_lineno)
+                        reports.setdefault(
+                            key,
+                            f"Blocking call to {module.__name__}.{name}{args[:1]!r}\n"
+                            + "".join(
+                                traceback.format_list(
+                                    traceback.extract_stack(sys._getframe(1))[-12:]  # noqa: SLF001
+                                )
+                            ),
+                        )
+                finally:
+                    recording = False
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    for module, names in BLOCKING_CALLS.items():
+        for name in names:
+            original = getattr(module, name)
+            monkeypatch.setattr(module, name, record(module, name, original))
+    return reports
+
+
+def jpeg() -> bytes:
+    """Return a small jpeg image."""
+    from PIL import Image  # noqa: PLC0415
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), "green").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+async def async_upload(hass: HomeAssistant, content: bytes) -> str:
+    """Upload a photo as the frontend does, returning its file id."""
+    if _DATA not in hass.data:
+        hass.data[_DATA] = await FileUploadData.create(hass)
+    file_id = ulid_hex()
+    data = hass.data[_DATA]
+
+    def _write() -> None:
+        data.file_dir(file_id).mkdir()
+        (data.file_dir(file_id) / "photo.jpg").write_bytes(content)
+
+    await hass.async_add_executor_job(_write)
+    data.files[file_id] = "photo.jpg"
+    return file_id
+
+
+async def test_no_blocking_call(  # noqa: PLR0915
+    hass: HomeAssistant,
+    tmp_path: Path,
+    blocking_calls: dict[tuple[str, int], str],
+) -> None:
+    """
+    Check that no code path of the integration blocks the event loop.
+
+    Sets up a few plants, one of them in compact mode and one with a photo,
+    and goes through setup, care buttons, dates, intervals and settings,
+    services, photos, a bulk import, the calendar and todo list, the config
+    and options flows, midnight, diagnostics and removal, in the debug mode.
+    """
+    photo = jpeg()
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / DOMAIN).mkdir()
+    (tmp_path / DOMAIN / "plant_0.jpg").write_bytes(photo)
+    media = tmp_path / "media"
+    media.mkdir()
+    (media / "new.jpg").write_bytes(photo)
+    hass.config.allowlist_external_dirs = {str(media)}
+    imported = [
+        plant_data(index)
+        | {"name": f"Imported {index}", "photo": str(media / "new.jpg")}
+        for index in range(4)
+    ]
+    (media / "plants.json").write_text(json.dumps(imported[:2]))
+    with (media / "plants.csv").open("w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(imported[2]))
+        writer.writeheader()
+        writer.writerows(imported[2:])
+
+    add_plants(hass, 1, photo=f"/{DOMAIN}/plant_0.jpg")
+    add_plants(hass, 1, 1, compact=True)
+    add_plants(hass, 3, 2)
+
+    def entity_ids(domain: str) -> list[str]:
+        return sorted(
+            entity_id
+            for entity_id in hass.states.async_entity_ids(domain)
+            if entity_id.endswith("_plant_0")
+        )
+
+    def entry(title: str) -> ConfigEntry:
+        return next(
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.title == title
+        )
+
+    def device_id(title: str) -> str:
+        devices = dr.async_entries_for_config_entry(
+            dr.async_get(hass), entry(title).entry_id
+        )
+        return devices[0].id
+
+    async def call(domain: str, service: str, data: dict, **kwargs: Any) -> Any:
+        response = await hass.services.async_call(
+            domain, service, data, blocking=True, **kwargs
+        )
+        await hass.async_block_till_done()
+        return response
+
+    # Setup
+    config = {DOMAIN: {"debug": {"slow_step_threshold": THRESHOLD}}}
+    assert await async_setup_component(hass, DOMAIN, config)
+    await hass.async_block_till_done()
+    monitor = hass.data[DATA_DEBUG]
+
+    # Care buttons
+    for entity_id in entity_ids("button"):
+        await call("button", "press", {"entity_id": entity_id})
+
+    # Dates, intervals and settings
+    for entity_id in entity_ids("date"):
+        await call("date", "set_value", {"entity_id": entity_id, "date": "2026-01-02"})
+    for entity_id in entity_ids("number"):
+        await call("number", "set_value", {"entity_id": entity_id, "value": 5})
+    for entity_id in entity_ids("select"):
+        option = hass.states.get(entity_id).attributes["options"][-1]
+        await call(
+            "select", "select_option", {"entity_id": entity_id, "option": option}
+        )
+
+    # Image
+    for entity_id in entity_ids("image"):
+        await hass.data["image"].get_entity(entity_id).async_image()
+
+    # Services
+    plant = device_id("Plant 0")
+    await call(
+        DOMAIN, "add_photo", {"device_id": plant, "file_path": str(media / "new.jpg")}
+    )
+    await call(DOMAIN, "list_photos", {"device_id": plant}, return_response=True)
+    await call(DOMAIN, "mark_care", {"device_id": plant, "care": ["watering"]})
+    await call(
+        DOMAIN,
+        "update_plant",
+        {"device_id": device_id("Plant 1"), "last_watered": "2026-01-03"},
+    )
+    await call(DOMAIN, "get_metrics", {}, return_response=True)
+
+    # Import
+    for name in ("plants.json", "plants.csv"):
+        await call(
+            DOMAIN,
+            "import_plants",
+            {"file_path": str(media / name)},
+            return_response=True,
+        )
+
+    # Calendar and todo list
+    now = hass.data[f"{DOMAIN}_clock"].utcnow()
+    await call(
+        "calendar",
+        "get_events",
+        {
+            "entity_id": f"calendar.{DOMAIN}_care",
+            "start_date_time": now,
+            "end_date_time": now + timedelta(days=365),
+        },
+        return_response=True,
+    )
+    todo = f"todo.{DOMAIN}_care"
+    items = await call("todo", "get_items", {"entity_id": todo}, return_response=True)
+    for item in items[todo]["items"][:3]:
+        await call(
+            "todo",
+            "update_item",
+            {"entity_id": todo, "item": item["uid"], "status": "completed"},
+        )
+
+    # Midnight
+    for coordinator in list(hass.data[DOMAIN].values()):
+        coordinator.async_handle_midnight(now)
+    await hass.async_block_till_done()
+
+    # Diagnostics
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        await async_get_config_entry_diagnostics(hass, config_entry)
+
+    # Config flow
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    data = plant_data(99)
+    del data["name_by_user"]
+    data |= {"name": "Plant new", "photo": await async_upload(hass, photo)}
+    await hass.config_entries.flow.async_configure(result["flow_id"], data)
+    await hass.async_block_till_done()
+
+    # Options flow, of a loaded and of an unloaded plant
+    await hass.config_entries.async_unload(entry("Plant new").entry_id)
+    for title in ("Plant 0", "Plant new"):
+        result = await hass.config_entries.options.async_init(entry(title).entry_id)
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {"photo": await async_upload(hass, photo)}
+        )
+        await hass.async_block_till_done()
+
+    # Reload
+    await hass.config_entries.async_reload(entry("Plant 2").entry_id)
+    await hass.async_block_till_done()
+
+    # Removal
+    for title in ("Plant 0", "Plant new"):
+        await hass.config_entries.async_remove(entry(title).entry_id)
+    await hass.async_block_till_done()
+
+    await hass.async_stop()
+    assert monitor.steps
+    assert not monitor.reports, "\n".join(monitor.reports.values())
+    assert not blocking_calls, "\n".join(blocking_calls.values())
@@ -0,0 +1,71 @@
+"""Debug mode of the integration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.setup import async_setup_component
+
+from custom_components.simple_plant_extended.clock import async_get_clock
+from custom_components.simple_plant_extended.const import DATA_DEBUG, DOMAIN
+from custom_components.simple_plant_extended.debug import INTEGRATION_DIR
+
+from .common import add_plants
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+
+
+async def test_debug_off(hass: HomeAssistant) -> None:
+    """Check that the loop isn't timed without the debug mode."""
+    handle_run = asyncio.events.Handle._run  # noqa: SLF001
+    add_plants(hass, 1)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    assert DATA_DEBUG not in hass.data
+    assert asyncio.events.Handle._run is handle_run  # noqa: SLF001
+
+
+async def test_slow_step_logged(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that a step of the integration over the threshold is logged."""
+    handle_run = asyncio.events.Handle._run  # noqa: SLF001
+    add_plants(hass, 1, 1)
+    config = {DOMAIN: {"debug": {"slow_step_threshold": 0.02}}}
+    assert await async_setup_component(hass, DOMAIN, config)
+    await hass.async_block_till_done()
+    monitor = hass.data[DATA_DEBUG]
+    assert monitor.threshold == 0.02  # noqa: PLR2004
+    assert not monitor.reports
+
+    clock = async_get_clock(hass)
+    today = clock.today
+
+    def slow_today() -> object:
+        time.sleep(0.1)
+        return today()
+
+    monkeypatch.setattr(clock, "today", slow_today)
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": f"button.{DOMAIN}_mark_watered_plant_1"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert monitor.slow_steps
+    assert monitor.reports
+    assert all(filename.startswith(INTEGRATION_DIR) for filename, _ in monitor.reports)
+    assert "Step held the loop" in caplog.text
+    assert "slow_today" in caplog.text
+
+    await hass.async_stop()
+    assert asyncio.events.Handle._run is handle_run  # noqa: SLF001
@@ -0,0 +1,100 @@
+"""Import time of the integration, against its budget."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Import time budget of the integration and its platforms, in milliseconds
+BUDGET_MS = 50
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules Home Assistant has already imported when it loads the integration
+BASELINE = [
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.button",
+    "homeassistant.components.calendar",
+    "homeassistant.components.date",
+    "homeassistant.components.image",
+    "homeassistant.components.number",
+    "homeassistant.components.select",
+    "homeassistant.components.sensor",
+    "homeassistant.components.todo",
+]
+MODULES = [
+    "",
+    ".binary_sensor",
+    ".button",
+    ".calendar",
+    ".config_flow",
+    ".date",
+    ".image",
+    ".number",
+    ".select",
+    ".sensor",
+    ".todo",
+]
+MARKER = "import time: -- simple_plant_extended --"
+RUNS = 3
+
+CODE = "\n".join(
+    [
+        "import sys",
+        *(f"import {module}" for module in BASELINE),
+        f"print({MARKER!r}, file=sys.stderr, flush=True)",
+        # Import statements, importlib.import_module is not timed
+        *(f"import custom_components.simple_plant_extended{m}" for m in MODULES),
+    ]
+)
+
+# Bytecode is written, as Home Assistant does, so that runs load it from cache
+ENV = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+
+def measure() -> list[tuple[float, str]]:
+    """Return the import time of each module imported by the integration."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", CODE],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env=ENV,
+    )
+
+    # Top level lines after the marker: each import done by the integration
+    imports = []
+    for line in result.stderr.partition(MARKER)[2].splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.startswith("  "):
+            imports.append((int(cumulative) / 1000, name.strip()))
+    return imports
+
+
+def test_import_time() -> None:
+    """
+    Check the import time of the integration and its platforms.
+
+    Measured with -X importtime in a new interpreter, on top of the Home
+    Assistant modules they build on.
+    """
+    # A first run compiles the modules, then the fastest of a few runs is
+    # kept, a single run varies with the load of the machine
+    measure()
+    imports = min(
+        (measure() for _ in range(RUNS)), key=lambda run: sum(ms for ms, _ in run)
+    )
+    total = sum(ms for ms, _ in imports)
+    assert total < BUDGET_MS, "\n".join(
+        [f"Import time {total:.1f} ms, over the budget"]
+        + [f"{ms:8.1f} ms  {name}" for ms, name in sorted(imports, reverse=True)[:10]]
+    )
@@ -0,0 +1,86 @@
+"""Memory a plant takes, against its budget."""
+
+from __future__ import annotations
+
+import gc
+import logging
+import tracemalloc
+from collections import Counter
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from homeassistant.setup import async_setup_component
+
+from custom_components.simple_plant_extended.const import DOMAIN
+
+from .common import add_plants, async_add_plants
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from homeassistant.core import HomeAssistant
+
+# Budget of a plant in KiB, see the README
+BUDGET_KIB = 300
+PLANTS = 20
+ADDED = 50
+
+
+@pytest.fixture
+def enable_event_loop_debug(event_loop: asyncio.AbstractEventLoop) -> None:
+    """Run the loop without the debug mode of tests, which keeps tracebacks."""
+    event_loop.set_debug(False)
+
+
+def place(traceback: tracemalloc.Traceback) -> str:
+    """Return the file where an allocation was made, from the package root."""
+    filename = traceback[-1].filename
+    for marker in (f"/custom_components/{DOMAIN}/", "/homeassistant/"):
+        if marker in filename:
+            return filename[filename.rindex(marker) + 1 :]
+    return filename
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["default", "compact"])
+async def test_plant_memory(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    compact: bool,  # noqa: FBT001
+) -> None:
+    """
+    Check the memory a plant takes against the budget.
+
+    Plants are added to a running fleet under tracemalloc. The memory still
+    allocated once they are set up, divided by their number, is the footprint
+    of a plant: its entities and their states, its coordinator and store
+    record, its device and entity registry entries.
+    """
+    # Captured log records and the calls of the mocked storage are kept by
+    # the test instance, not by the plants
+    caplog.set_level(logging.WARNING)
+    add_plants(hass, PLANTS)
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    # The first plants added at runtime fill the caches of Home Assistant
+    await async_add_plants(hass, 5, PLANTS, compact=compact)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    await async_add_plants(hass, ADDED, PLANTS + 5, compact=compact)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    mocks = [tracemalloc.Filter(inclusive=False, filename_pattern=mock.__file__)]
+    places: Counter[str] = Counter()
+    for stat in after.filter_traces(mocks).compare_to(
+        before.filter_traces(mocks), "filename"
+    ):
+        places[place(stat.traceback)] += stat.size_diff / ADDED / 1024
+    per_plant = sum(places.values())
+    assert per_plant < BUDGET_KIB, "\n".join(
+        [f"A plant takes {per_plant:.1f} KiB, over the budget"]
+        + [f"{size:8.1f} KiB  {name}" for name, size in places.most_common(15)]
+    )